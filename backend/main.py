@@ -1,15 +1,19 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+import logging
 import os
 
 # Charger variables d'environnement
 load_dotenv()
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 
 app = FastAPI(
     title="Apex Replay API",
     description="Driver training through telemetry analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -35,9 +39,11 @@ def health_check():
 
 @app.get("/api/clear-cache")
 def clear_cache():
-    """Clear all caches"""
+    """Clear all caches of the worker process serving this request (see workers below)"""
     from services.data_processor import processor
+    from routers.analysis import clear_analysis_cache
     processor.clear_cache()
+    clear_analysis_cache()
     return {"status": "cache cleared"}
 
 # Import des routers ICI (après création de app)
@@ -53,9 +59,23 @@ app.include_router(replay_router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
\ No newline at end of file
+
+    # uvloop + httptools ship with uvicorn[standard] (pinned in requirements.txt)
+    run_options = {
+        "host": "0.0.0.0",
+        "port": 8000,
+        "loop": "uvloop",
+        "http": "httptools",
+    }
+    # reload and workers are mutually exclusive in uvicorn: reload forces a single process
+    if os.getenv("ENVIRONMENT", "development") == "development":
+        run_options["reload"] = True
+    else:
+        # CSV bootstrap already ran in this parent process on import, so workers
+        # only build their own (lazily filled) processor and analysis caches.
+        # Those caches (and cache_version, hence the compare ETags) are per process:
+        # /api/clear-cache only reaches the worker that answers it, the others keep
+        # their data until restarted. Set UVICORN_WORKERS=1 if clears must be global.
+        run_options["workers"] = int(os.getenv("UVICORN_WORKERS", max(2, os.cpu_count() or 2)))
+
+    uvicorn.run("main:app", **run_options)
\ No newline at end of file
@@ -1,16 +1,22 @@
+import asyncio
+import hashlib
+import logging
 import os
-import traceback
-from collections import OrderedDict
-from copy import deepcopy
-from typing import Optional
+import random
+import time
+from typing import Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from services.ai_coach import ai_coach
+from services.ai_coach import get_ai_coach
 from services.data_processor import processor
+from services.json_utils import ORJSON_OPTIONS, json_default
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 class CompareRequest(BaseModel):
@@ -21,69 +27,178 @@ class CompareRequest(BaseModel):
     race: str = "R1"
 
 
-_CACHE_LIMIT = int(os.getenv("ANALYSIS_CACHE_LIMIT", "32"))
-_analysis_cache: "OrderedDict[str, dict]" = OrderedDict()
+# Budget in bytes rather than entries: payloads range from KBs to several MBs
+_CACHE_BYTES = int(os.getenv("ANALYSIS_CACHE_BYTES", str(128 * 1024 * 1024)))
+_EVICTION_SAMPLES = 5
+# key -> (JSON bytes, ai_coach JSON bytes, last access time); eviction samples a few
+# keys instead of keeping a recency list, so hits only rewrite the timestamp.
+# ai_coach is stored pre-serialized so /compare/stream hits never re-parse the body.
+_analysis_cache: Dict[str, Tuple[bytes, bytes, float]] = {}
+_cache_stats = {"bytes": 0, "hits": 0, "misses": 0, "evictions": 0}
 
 
 def _make_cache_key(request: CompareRequest) -> str:
     return f"{request.circuit}:{request.chassis}:{request.car_number}:{request.lap}:{request.race}:v2"
 
 
-def _cache_get(key: str) -> Optional[dict]:
-    cached = _analysis_cache.get(key)
-    if cached is not None:
-        _analysis_cache.move_to_end(key)
-        return deepcopy(cached)
-    return None
+def _make_etag(cache_key: str) -> str:
+    # Weak: the key identifies the comparison, AI wording may differ between recomputes.
+    # cache_version is mixed in so clients revalidate after /api/clear-cache.
+    tag = f"{cache_key}:{processor.cache_version}"
+    return f'W/"{hashlib.blake2b(tag.encode(), digest_size=8).hexdigest()}"'
+
+
+def clear_analysis_cache() -> None:
+    """Drop every cached comparison (called by /api/clear-cache)"""
+    _analysis_cache.clear()
+    _cache_stats.update(bytes=0, hits=0, misses=0, evictions=0)
 
 
-def _cache_set(key: str, payload: dict) -> None:
-    _analysis_cache[key] = deepcopy(payload)
-    _analysis_cache.move_to_end(key)
-    while len(_analysis_cache) > _CACHE_LIMIT:
-        _analysis_cache.popitem(last=False)
+def _etag_matches(http_request: Request, etag: str) -> bool:
+    header = http_request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in header.split(","))
+
+
+def _cache_get(key: str) -> Optional[Tuple[bytes, bytes]]:
+    """(body, ai_coach) JSON bytes, or None on a miss"""
+    cached = _analysis_cache.get(key)
+    if cached is None:
+        _cache_stats["misses"] += 1
+        return None
+    _cache_stats["hits"] += 1
+    body, ai_body, _ = cached
+    _analysis_cache[key] = (body, ai_body, time.monotonic())
+    return body, ai_body
+
+
+def _evict_one() -> None:
+    sample = random.sample(list(_analysis_cache), min(_EVICTION_SAMPLES, len(_analysis_cache)))
+    oldest = min(sample, key=lambda k: _analysis_cache[k][2])
+    body, ai_body, _ = _analysis_cache.pop(oldest)
+    _cache_stats["bytes"] -= len(body) + len(ai_body)
+    _cache_stats["evictions"] += 1
+
+
+def _cache_set(key: str, payload: dict) -> Tuple[bytes, bytes]:
+    # Cached entries are immutable JSON bytes, so hits need no copy or re-encoding
+    body = orjson.dumps(payload, option=ORJSON_OPTIONS, default=json_default)
+    ai_body = orjson.dumps(payload.get("ai_coach"), option=ORJSON_OPTIONS, default=json_default)
+    size = len(body) + len(ai_body)
+    if size > _CACHE_BYTES:
+        return body, ai_body
+
+    previous = _analysis_cache.pop(key, None)
+    if previous is not None:
+        _cache_stats["bytes"] -= len(previous[0]) + len(previous[1])
+    evictions = _cache_stats["evictions"]
+    while _analysis_cache and _cache_stats["bytes"] + size > _CACHE_BYTES:
+        _evict_one()
+    _analysis_cache[key] = (body, ai_body, time.monotonic())
+    _cache_stats["bytes"] += size
+
+    if _cache_stats["evictions"] != evictions:
+        logger.info(
+            "analysis cache: %d entries, %d bytes (hits=%d misses=%d evictions=%d)",
+            len(_analysis_cache), _cache_stats["bytes"], _cache_stats["hits"],
+            _cache_stats["misses"], _cache_stats["evictions"]
+        )
+    return body, ai_body
 
 
 @router.get("/golden/{circuit}")
-def get_golden_lap(circuit: str, race: str = "R1"):
+async def get_golden_lap(circuit: str, race: str = "R1"):
     """Get golden lap information"""
     try:
-        golden = processor.find_golden_lap(circuit, race)
+        golden = await asyncio.to_thread(processor.find_golden_lap, circuit, race)
         return golden
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _merge_ai_result(result: dict, ai_result: dict) -> None:
+    result.update(ai_result)  # Merge AI results (summary, recommendations, track_insights) into top level
+    result["ai_coach"] = ai_result # Keep nested for backward compat if needed, or just for clarity
+
+
+def _http_error(e: Exception) -> HTTPException:
+    # 400/404 are expected (bad lap, missing file): log one line, no stack trace
+    if isinstance(e, ValueError):
+        logger.warning("compare failed (ValueError): %s", e)
+        return HTTPException(status_code=400, detail=str(e))
+    if isinstance(e, FileNotFoundError):
+        logger.warning("compare failed (FileNotFoundError): %s", e)
+        return HTTPException(status_code=404, detail=str(e))
+    logger.exception("compare failed (unexpected error): %s", e)
+    return HTTPException(status_code=500, detail=str(e))
+
+
+async def _run_comparison(request: CompareRequest) -> dict:
+    return await asyncio.to_thread(
+        processor.compare_laps,
+        request.circuit,
+        request.chassis,
+        request.car_number,
+        request.lap,
+        request.race
+    )
+
+
+def _sse_event(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
 @router.post("/compare")
-def compare_lap(request: CompareRequest):
+async def compare_lap(request: CompareRequest, http_request: Request):
     """Compare a lap against the golden lap"""
     try:
         cache_key = _make_cache_key(request)
+        etag = _make_etag(cache_key)
+        if _etag_matches(http_request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
         cached = _cache_get(cache_key)
-        if cached:
-            return cached
-
-        result = processor.compare_laps(
-            request.circuit,
-            request.chassis,
-            request.car_number,
-            request.lap,
-            request.race
-        )
-        ai_result = ai_coach.generate_insights(result)
-        result.update(ai_result)  # Merge AI results (summary, recommendations, track_insights) into top level
-        result["ai_coach"] = ai_result # Keep nested for backward compat if needed, or just for clarity
-        _cache_set(cache_key, result)
-        return result
-    except ValueError as e:
-        print(f"❌ ValueError: {e}")
-        traceback.print_exc()
-        raise HTTPException(status_code=400, detail=str(e))
-    except FileNotFoundError as e:
-        print(f"❌ FileNotFoundError: {e}")
-        traceback.print_exc()
-        raise HTTPException(status_code=404, detail=str(e))
+        if cached is not None:
+            return Response(content=cached[0], media_type="application/json", headers={"ETag": etag})
+
+        result = await _run_comparison(request)
+        ai_result = await get_ai_coach().generate_insights_async(result)
+        _merge_ai_result(result, ai_result)
+        body, _ = _cache_set(cache_key, result)
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+        raise _http_error(e)
+
+
+@router.post("/compare/stream")
+async def compare_lap_stream(request: CompareRequest):
+    """Stream the comparison as soon as it is ready, then the AI coach insights"""
+    cache_key = _make_cache_key(request)
+    cached = _cache_get(cache_key)
+
+    if cached is not None:
+        body, ai_body = cached
+
+        async def cached_events():
+            yield _sse_event("compare", body)
+            yield _sse_event("ai_coach", ai_body)
+
+        return StreamingResponse(cached_events(), media_type="text/event-stream")
+
+    try:
+        result = await _run_comparison(request)
+    except Exception as e:
+        raise _http_error(e)
+
+    compare_body = orjson.dumps(result, option=ORJSON_OPTIONS, default=json_default)
+    ai_task = asyncio.create_task(get_ai_coach().generate_insights_async(result))
+
+    async def events():
+        yield _sse_event("compare", compare_body)
+        ai_result = await ai_task
+        _merge_ai_result(result, ai_result)
+        _, ai_body = _cache_set(cache_key, result)
+        yield _sse_event("ai_coach", ai_body)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
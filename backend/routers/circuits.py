@@ -1,4 +1,10 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import functools
+import os
+from typing import Dict, Tuple
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from services.data_processor import processor
 
 router = APIRouter()
@@ -39,23 +45,49 @@ def _get_available_circuit_map():
     available = processor.get_available_circuits()
     return {c["id"]: c for c in available}
 
-@router.get("/")
-def list_circuits():
-    """List all available circuits"""
-    circuit_map = _get_available_circuit_map()
-    if not circuit_map:
-        return []
+def _data_mtimes() -> Tuple[int, ...]:
+    """mtime of the data dir and of each circuit dir: adding a circuit or a race file changes it"""
+    try:
+        mtimes = [os.stat(processor.data_path).st_mtime_ns]
+        with os.scandir(processor.data_path) as it:
+            mtimes.extend(
+                entry.stat().st_mtime_ns
+                for entry in sorted(it, key=lambda e: e.name)
+                if entry.is_dir() and not entry.name.startswith('.')
+            )
+    except OSError:
+        return ()
+    return tuple(mtimes)
 
-    return [
+@functools.lru_cache(maxsize=1)
+def _render_circuits(cache_version: int, data_mtimes: Tuple[int, ...]) -> Tuple[bytes, Dict[str, bytes]]:
+    """Pre-render listing and detail JSON; re-rendered on clear_cache or when the data directories change."""
+    circuit_map = _get_available_circuit_map()
+    listing = [
         _merge_circuit_payload(entry)
         for entry in sorted(circuit_map.values(), key=lambda item: item.get("name", item["id"]))
     ]
+    details = {
+        circuit_id: orjson.dumps(_merge_circuit_payload(entry, extended=True))
+        for circuit_id, entry in circuit_map.items()
+    }
+    return orjson.dumps(listing), details
+
+def _circuit_payloads() -> Tuple[bytes, Dict[str, bytes]]:
+    return _render_circuits(processor.cache_version, _data_mtimes())
+
+@router.get("/")
+async def list_circuits():
+    """List all available circuits"""
+    # Directory stats and (on a miss) the scan itself stay off the event loop
+    listing, _ = await asyncio.to_thread(_circuit_payloads)
+    return Response(content=listing, media_type="application/json")
 
 @router.get("/{circuit}")
-def get_circuit_info(circuit: str):
+async def get_circuit_info(circuit: str):
     """Get detailed info about a circuit"""
-    circuit_map = _get_available_circuit_map()
-    entry = circuit_map.get(circuit)
-    if not entry:
+    _, details = await asyncio.to_thread(_circuit_payloads)
+    payload = details.get(circuit)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Circuit not found")
-    return _merge_circuit_payload(entry, extended=True)
+    return Response(content=payload, media_type="application/json")
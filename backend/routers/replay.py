@@ -1,32 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict, Any
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Any, Tuple
 from pydantic import BaseModel
-from services.data_processor import RaceDataProcessor
+from services.data_processor import RaceDataProcessor, processor
 from services.replay_processor import ReplayProcessor
 
 router = APIRouter(prefix="/api/replay", tags=["replay"])
 
-# Dependency to get processors
-# In a real app, these might be singletons or injected
-_data_processor = None
-_replay_processor = None
+# Module-level singletons: share the global data processor (and its caches)
+# with the other routers instead of building a second one on first request
+_data_processor = processor
+_replay_processor = ReplayProcessor(_data_processor)
 
-def get_processors():
-    global _data_processor, _replay_processor
-    if _data_processor is None:
-        _data_processor = RaceDataProcessor()
-    if _replay_processor is None:
-        _replay_processor = ReplayProcessor(_data_processor)
+def get_processors() -> Tuple[RaceDataProcessor, ReplayProcessor]:
     return _data_processor, _replay_processor
 
 class ReplayRequest(BaseModel):
     circuit: str
     laps: List[Dict[str, Any]] # [{'chassis': '...', 'car_number': 99, 'lap': 1}, ...]
 
-class CommentaryRequest(BaseModel):
-    cars: List[Dict[str, Any]]
-    current_time: float
-
 @router.get("/setup/{circuit}")
 async def get_replay_setup(circuit: str):
     dp, _ = get_processors()
@@ -49,32 +43,53 @@ async def get_vehicle_laps(circuit: str, chassis: str, car: int):
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-@router.post("/prepare")
+def _prepare_timeline(rp: ReplayProcessor, circuit: str, item: Dict[str, Any]):
+    timeline = rp.normalize_lap_to_timeline(
+        circuit,
+        item['chassis'],
+        item['car_number'],
+        item['lap']
+    )
+    if timeline:
+        # Add display info
+        timeline['name'] = item.get('name', f"Car {item['car_number']}")
+        timeline['color'] = item.get('color', '#ffffff')
+    return timeline
+
+@router.post("/prepare", response_class=ORJSONResponse)
 async def prepare_replay(request: ReplayRequest):
     _, rp = get_processors()
+
+    # Laps are independent and mostly NumPy/Parquet work, so normalize them in parallel threads
+    timelines = await asyncio.gather(
+        *(asyncio.to_thread(_prepare_timeline, rp, request.circuit, item) for item in request.laps),
+        return_exceptions=True
+    )
+
     results = []
-    
-    for item in request.laps:
-        try:
-            timeline = rp.normalize_lap_to_timeline(
-                request.circuit,
-                item['chassis'],
-                item['car_number'],
-                item['lap']
-            )
-            if timeline:
-                # Add display info
-                timeline['name'] = item.get('name', f"Car {item['car_number']}")
-                timeline['color'] = item.get('color', '#ffffff')
-                results.append(timeline)
-        except Exception as e:
-            print(f"Failed to prepare lap {item}: {e}")
+    for item, timeline in zip(request.laps, timelines):
+        if isinstance(timeline, Exception):
+            print(f"Failed to prepare lap {item}: {timeline}")
             continue
+        if timeline:
+            results.append(timeline)
             
-    return {"timelines": results}
+    # Returning the response directly skips jsonable_encoder's per-element walk
+    return ORJSONResponse({"timelines": results})
 
-@router.post("/commentary")
-async def get_commentary(request: CommentaryRequest):
+@router.post("/commentary", response_class=ORJSONResponse)
+async def get_commentary(request: Request):
+    # Sent on every animation tick: skip Pydantic validation and the .dict() copy
+    try:
+        race_state = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(race_state, dict):
+        raise HTTPException(status_code=400, detail="Expected a JSON object")
+    # What the dropped CommentaryRequest model checked: generate_commentary reads each car with .get()
+    cars = race_state.get('cars')
+    if not isinstance(cars, list) or not all(isinstance(car, dict) for car in cars):
+        raise HTTPException(status_code=400, detail="'cars' must be a list of objects")
     _, rp = get_processors()
-    comment = rp.generate_commentary(request.dict())
+    comment = rp.generate_commentary(race_state)
     return {"comment": comment}
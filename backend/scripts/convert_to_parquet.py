@@ -1,35 +1,53 @@
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from pathlib import Path
 import sys
 
+# Types explicites pour les colonnes connues (télémétrie + lap events).
+# Les chaînes répétées sont encodées en dictionnaire, les entiers réduits.
+# telemetry_value reste en float64 : il porte aussi les coordonnées GPS.
+DTYPE_MAP = {
+    "vehicle_id": pa.dictionary(pa.int32(), pa.string()),
+    "original_vehicle_id": pa.dictionary(pa.int32(), pa.string()),
+    "telemetry_name": pa.dictionary(pa.int32(), pa.string()),
+    "meta_event": pa.dictionary(pa.int32(), pa.string()),
+    "meta_session": pa.dictionary(pa.int32(), pa.string()),
+    "meta_source": pa.dictionary(pa.int32(), pa.string()),
+    "vehicle_number": pa.int16(),
+    "outing": pa.int16(),
+    "lap": pa.int32(),
+}
+
 def convert_csv_to_parquet(csv_path: Path):
     """Convert a single CSV to Parquet"""
     parquet_path = csv_path.with_suffix('.parquet')
     
     print(f"\n📄 {csv_path.name}")
-    print(f"  → Reading CSV (this may take a while)...")
+    print(f"  → Streaming CSV to Parquet (this may take a while)...")
     
-    # Lire par chunks
-    chunks = []
-    chunk_size = 500000
+    # Lecteur CSV multithread d'Arrow, par blocs de 64 MB
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=1 << 26, use_threads=True),
+        convert_options=pa_csv.ConvertOptions(column_types=DTYPE_MAP)
+    )
     total_rows = 0
     
-    for i, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
-        chunks.append(chunk)
-        total_rows += len(chunk)
-        print(f"    Chunk {i+1}: {len(chunk):,} rows (total: {total_rows:,})")
-    
-    df = pd.concat(chunks, ignore_index=True)
-    print(f"  → Total: {len(df):,} rows")
-    
-    # Sauvegarder en Parquet
-    print(f"  → Writing Parquet with compression...")
-    df.to_parquet(
+    # Écrire chaque batch directement, sans tout concaténer en mémoire
+    with pq.ParquetWriter(
         parquet_path,
-        engine='pyarrow',
-        compression='snappy',
-        index=False
-    )
+        reader.schema,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=True
+    ) as writer:
+        for i, batch in enumerate(reader):
+            writer.write_batch(batch)
+            total_rows += batch.num_rows
+            print(f"    Batch {i+1}: {batch.num_rows:,} rows (total: {total_rows:,})")
+    
+    print(f"  → Total: {total_rows:,} rows")
     
     # Comparer tailles
     csv_size = csv_path.stat().st_size / (1024**2)  # MB
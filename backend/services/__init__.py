@@ -1,2 +1,10 @@
-from .data_processor import RaceDataProcessor
-from .ai_coach import ai_coach
+# Exports resolved on first access (PEP 562): importing a submodule such as
+# services.ai_coach must not build the global processor as a side effect.
+def __getattr__(name):
+    if name == "RaceDataProcessor":
+        from .data_processor import RaceDataProcessor
+        return RaceDataProcessor
+    if name == "get_ai_coach":
+        from .ai_coach import get_ai_coach
+        return get_ai_coach
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
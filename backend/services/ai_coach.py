@@ -1,9 +1,12 @@
+import asyncio
+import functools
 import json
 import os
-import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-import numpy as np
+import orjson
+
+from services.json_utils import ORJSON_OPTIONS, json_default
 
 try:
     from google import genai
@@ -11,11 +14,61 @@ except ImportError:
     genai = None
 
 
+BATCH_WINDOW_MS = int(os.getenv("GEMINI_BATCH_WINDOW_MS", "30"))
+MAX_BATCH = int(os.getenv("GEMINI_MAX_BATCH", "8"))
+
+
+_RESPONSE_SCHEMA = """{
+  "summary": "High level overview in <=60 words.",
+  "race_brief": "Optional note (<=40 words) about track/weather/race context if relevant.",
+  "recommendations": [
+    {
+      "title": "Short hook (<=6 words)",
+      "detail": "Actionable explanation (<=60 words)",
+      "focus_area": "e.g. Braking, Turn-in, Exit, Consistency, Racecraft",
+      "estimated_gain": "Optional description like '+0.25s' or 'Maintain +6 km/h'",
+      "confidence": "high|medium|low"
+    }
+  ],
+  "track_insights": [
+    {
+      "sector": 1, // integer sector number (1-based)
+      "type": "Braking|Line|Throttle|Gear|Strategy",
+      "color": "#hexcode", // Use mapping below
+      "message": "Short insight (<= 5 words)",
+      "detail": "Detailed explanation (<= 20 words)"
+    }
+  ]
+}"""
+
+_COLOR_MAPPING = """
+COLOR MAPPING for track_insights:
+- Braking: #ef4444 (Red)
+- Line: #3b82f6 (Blue)
+- Throttle: #10b981 (Green)
+- Gear: #f59e0b (Amber)
+- Strategy: #8b5cf6 (Purple)
+"""
+
+_PROMPT_PREFIX = """
+You are Apex Replay, an expert driving instructor.
+Analyze the telemetry summary below and produce targeted coaching recommendations and specific track insights.
+
+DATA (JSON):
+"""
+
+_PROMPT_SUFFIX = "\n\nRespond strictly in JSON using this schema:\n" + _RESPONSE_SCHEMA + "\n" + _COLOR_MAPPING
+
+
 class AICoachService:
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
         self.model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
         self.client = None
+        self._batch_queue = None
+        self._batch_loop = None
+        self._batch_task = None
+        self._inflight = set()
 
         if self.api_key and genai:
             try:
@@ -51,107 +104,129 @@ class AICoachService:
         }
         return payload
 
-    def generate_insights(self, compare_result: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.client:
-            return {
-                "summary": "AI Coach is not configured. Set GEMINI_API_KEY to enable enhanced guidance.",
-                "recommendations": []
-            }
-
-        payload = self._build_prompt_payload(compare_result)
-        def serialize_payload(data: Dict[str, Any]) -> str:
-            class Encoder(json.JSONEncoder):
-                def default(self, obj):
-                    if isinstance(obj, np.integer):
-                        return int(obj)
-                    if isinstance(obj, np.floating):
-                        return float(obj)
-                    if hasattr(obj, 'item'):
-                        try:
-                            return obj.item()
-                        except Exception:
-                            return super().default(obj)
-                    return super().default(obj)
-
-            return json.dumps(data, cls=Encoder)
-
-        prompt = f"""
+    def _build_prompt(self, payload: Dict[str, Any]) -> str:
+        return _PROMPT_PREFIX + self._serialize_payload(payload) + _PROMPT_SUFFIX
+
+    def _build_batch_prompt(self, payloads: List[Dict[str, Any]]) -> str:
+        return f"""
 You are Apex Replay, an expert driving instructor.
-Analyze the telemetry summary below and produce targeted coaching recommendations and specific track insights.
+Each element of the JSON array below is an independent telemetry summary for a different driver.
+Analyze every summary separately and produce targeted coaching recommendations and specific track insights for each.
 
-DATA (JSON):
-{serialize_payload(payload)}
+DATA (JSON array of {len(payloads)} summaries):
+{self._serialize_payload(payloads)}
 
-Respond strictly in JSON using this schema:
-{{
-  "summary": "High level overview in <=60 words.",
-  "race_brief": "Optional note (<=40 words) about track/weather/race context if relevant.",
-  "recommendations": [
-    {{
-      "title": "Short hook (<=6 words)",
-      "detail": "Actionable explanation (<=60 words)",
-      "focus_area": "e.g. Braking, Turn-in, Exit, Consistency, Racecraft",
-      "estimated_gain": "Optional description like '+0.25s' or 'Maintain +6 km/h'",
-      "confidence": "high|medium|low"
-    }}
-  ],
-  "track_insights": [
-    {{
-      "sector": 1, // integer sector number (1-based)
-      "type": "Braking|Line|Throttle|Gear|Strategy",
-      "color": "#hexcode", // Use mapping below
-      "message": "Short insight (<= 5 words)",
-      "detail": "Detailed explanation (<= 20 words)"
-    }}
-  ]
-}}
+Respond strictly with a JSON array of exactly {len(payloads)} objects, in the same order as the input.
+Each object must use this schema:
+{_RESPONSE_SCHEMA}
+{_COLOR_MAPPING}"""
 
-COLOR MAPPING for track_insights:
-- Braking: #ef4444 (Red)
-- Line: #3b82f6 (Blue)
-- Throttle: #10b981 (Green)
-- Gear: #f59e0b (Amber)
-- Strategy: #8b5cf6 (Purple)
-"""
+    def _serialize_payload(self, data: Any) -> str:
+        return orjson.dumps(data, option=ORJSON_OPTIONS, default=json_default).decode()
+
+    def _disabled_response(self) -> Dict[str, Any]:
+        return {
+            "summary": "AI Coach is not configured. Set GEMINI_API_KEY to enable enhanced guidance.",
+            "recommendations": []
+        }
+
+    def _unavailable_response(self) -> Dict[str, Any]:
+        return {
+            "summary": "AI Coach is temporarily unavailable.",
+            "recommendations": []
+        }
+
+    def _load_response_json(self, raw_text: Optional[str]) -> Any:
+        text = self._extract_json_block(raw_text)
+        if not text:
+            raise ValueError("Gemini response lacked JSON content.")
+        return json.loads(text)
+
+    def _parse_insights(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        summary = data.get("summary") or "AI Coach summary unavailable."
+        recs = data.get("recommendations") or []
+        track_insights = data.get("track_insights") or []
+        race_brief = data.get("race_brief")
+
+        cleaned_recs: List[Dict[str, str]] = []
+        for rec in recs:
+            cleaned_recs.append({
+                "title": rec.get("title", "Suggested focus"),
+                "detail": rec.get("detail", ""),
+                "focus_area": rec.get("focus_area", "Driving"),
+                "estimated_gain": rec.get("estimated_gain"),
+                "confidence": rec.get("confidence", "medium")
+            })
+
+        return {
+            "summary": summary,
+            "ai_recommendations": cleaned_recs,
+            "track_insights": track_insights,
+            "race_brief": race_brief
+        }
+
+    async def generate_insights_async(self, compare_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue the request so concurrent comparisons share one Gemini call."""
+        if not self.client:
+            return self._disabled_response()
+
+        loop = asyncio.get_running_loop()
+        if self._batch_queue is None or self._batch_loop is not loop:
+            self._batch_queue = asyncio.Queue()
+            self._batch_loop = loop
+            self._batch_task = loop.create_task(self._run_batcher(self._batch_queue))
+
+        future = loop.create_future()
+        await self._batch_queue.put((self._build_prompt_payload(compare_result), future))
+        return await future
+
+    async def _run_batcher(self, queue: "asyncio.Queue") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + BATCH_WINDOW_MS / 1000
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without awaiting so the next window fills while Gemini works.
+            task = loop.create_task(self._dispatch_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch_batch(self, batch: List[Tuple[Dict[str, Any], "asyncio.Future"]]) -> None:
+        payloads = [payload for payload, _ in batch]
         try:
-            response = self.client.models.generate_content(
+            if len(payloads) == 1:
+                prompt = self._build_prompt(payloads[0])
+            else:
+                prompt = self._build_batch_prompt(payloads)
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=prompt
             )
-            text = self._extract_json_block(response.text)
-            if not text:
-                raise ValueError("Gemini response lacked JSON content.")
-            data = json.loads(text)
-            summary = data.get("summary") or "AI Coach summary unavailable."
-            recs = data.get("recommendations") or []
-            track_insights = data.get("track_insights") or []
-            race_brief = data.get("race_brief")
-            
-            cleaned_recs: List[Dict[str, str]] = []
-            for rec in recs:
-                cleaned_recs.append({
-                    "title": rec.get("title", "Suggested focus"),
-                    "detail": rec.get("detail", ""),
-                    "focus_area": rec.get("focus_area", "Driving"),
-                    "estimated_gain": rec.get("estimated_gain"),
-                    "confidence": rec.get("confidence", "medium")
-                })
-                
-            return {
-                "summary": summary,
-                "ai_recommendations": cleaned_recs,
-                "track_insights": track_insights,
-                "race_brief": race_brief
-            }
+            data = self._load_response_json(response.text)
+            if len(payloads) == 1:
+                results = [self._parse_insights(data)]
+            else:
+                if not isinstance(data, list) or len(data) != len(payloads):
+                    raise ValueError(f"Gemini batch response did not contain {len(payloads)} entries.")
+                results = [self._parse_insights(item) for item in data]
         except json.JSONDecodeError:
             print("⚠️  Gemini response was not valid JSON.")
+            results = [self._unavailable_response() for _ in payloads]
         except Exception as exc:
             print(f"⚠️  Gemini request failed: {exc}")
+            results = [self._unavailable_response() for _ in payloads]
 
-        return {
-            "summary": "AI Coach is temporarily unavailable.",
-            "recommendations": []
-        }
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
     def _extract_json_block(self, raw_text: Optional[str]) -> Optional[str]:
         if not raw_text:
@@ -159,10 +234,18 @@ COLOR MAPPING for track_insights:
         stripped = raw_text.strip()
         if stripped.startswith("{"):
             return stripped
-        fenced = re.search(r"```(?:json)?\s*(.*?)```", stripped, re.DOTALL | re.IGNORECASE)
-        if fenced:
-            return fenced.group(1).strip()
+        start = stripped.find("```")
+        if start != -1:
+            end = stripped.find("```", start + 3)
+            if end != -1:
+                fenced = stripped[start + 3:end]
+                if fenced[:4].lower() == "json":
+                    fenced = fenced[4:]
+                return fenced.strip()
         return stripped
 
 
-ai_coach = AICoachService()
+@functools.lru_cache(maxsize=1)
+def get_ai_coach() -> AICoachService:
+    """Build the AI coach on first use instead of at import (one per worker)."""
+    return AICoachService()
@@ -1,13 +1,288 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import io
 import os
 import re
+import sys
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 import math
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# ZSTD + dictionaries: much smaller files than snappy for the repetitive string columns,
+# and min/max statistics so lap filters can skip row groups
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+    "write_statistics": True,
+}
+# Memory budget (bytes) shared by all RaceDataProcessor caches of a worker process,
+# least recently used entries go first (DATA_CACHE_MAX_BYTES, default 2 GiB)
+CACHE_MAX_BYTES = int(os.getenv("DATA_CACHE_MAX_BYTES", 2 << 30))
+
+# Telemetry is rewritten sorted by (lap, vehicle_id) in small row groups so that
+# lap == X reads only touch the row groups of that lap
+LAP_SORT_ROW_GROUP_SIZE = 256_000
+SORT_MEMORY_BYTES = int(os.getenv("PARQUET_SORT_MEMORY_BYTES", 512 << 20))
+
+
+def _sort_parquet_by_lap(source: Path, target: Path, bytes_per_row: float):
+    """Rewrite source sorted by (lap, vehicle_id), one lap range at a time within SORT_MEMORY_BYTES"""
+    schema = pq.read_schema(source)
+    sort_keys = [(col, 'ascending') for col in ('lap', 'vehicle_id') if col in schema.names]
+    rows_budget = max(LAP_SORT_ROW_GROUP_SIZE, int(SORT_MEMORY_BYTES / max(bytes_per_row, 1.0)))
+
+    lap_counts = pc.value_counts(pq.read_table(source, columns=['lap'])['lap'])
+    laps = lap_counts.field('values')
+    order = pc.sort_indices(laps)
+    ranges = []
+    low = high = None
+    rows = 0
+    for lap, count in zip(laps.take(order).to_pylist(), lap_counts.field('counts').take(order).to_pylist()):
+        if lap is None:
+            continue
+        if low is not None and rows + count > rows_budget:
+            ranges.append((low, high))
+            low, rows = None, 0
+        if low is None:
+            low = lap
+        high = lap
+        rows += count
+    if low is not None:
+        ranges.append((low, high))
+
+    if len(ranges) <= 1:
+        filters = [None]
+    else:
+        lap_field = ds.field('lap')
+        filters = [(lap_field >= low) & (lap_field <= high) for low, high in ranges]
+        filters.append(lap_field.is_null())
+
+    with pq.ParquetWriter(target, schema, **PARQUET_WRITE_OPTIONS) as writer:
+        for lap_filter in filters:
+            table = pq.read_table(source, filters=lap_filter)
+            if table.num_rows:
+                writer.write_table(table.sort_by(sort_keys), row_group_size=LAP_SORT_ROW_GROUP_SIZE)
+
+
+if numba is not None:
+    # fastmath without 'nnan': the NaN guard below must survive compilation
+    @numba.njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _haversine_speed_kernel(lon1, lat1, lon2, lat2, dt, out_speed):
+        """Fused haversine + speed (km/h, clipped to 0-250) in one pass over degree inputs"""
+        for i in numba.prange(out_speed.shape[0]):
+            if (np.isnan(lon1[i]) or np.isnan(lat1[i]) or np.isnan(lon2[i]) or np.isnan(lat2[i])
+                    or not dt[i] > 0):
+                out_speed[i] = 0.0
+                continue
+            phi1 = math.radians(lat1[i])
+            phi2 = math.radians(lat2[i])
+            a = (math.sin((phi2 - phi1) / 2) ** 2
+                 + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2[i] - lon1[i]) / 2) ** 2)
+            speed = 2 * 6371000 * math.asin(math.sqrt(a)) / dt[i] * 3.6
+            out_speed[i] = min(max(speed, 0.0), 250.0)
+else:
+    _haversine_speed_kernel = None
+
+
+def _round_significant(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round to `digits` significant digits, in float64 (non-finite values pass through)"""
+    x = values.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decimals = digits - 1 - np.floor(np.log10(np.abs(x)))
+    decimals = np.where(np.isfinite(decimals), decimals, 0).astype(np.int64)
+    scale = 10.0 ** np.abs(decimals)
+    # Divide by an exact power of ten rather than multiply by its (inexact) inverse
+    rounded = np.where(decimals >= 0, np.round(x * scale) / scale, np.round(x / scale) * scale)
+    return np.where(np.isfinite(x), rounded, x)
+
+
+def widen_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """float32 columns back to float64 via their shortest decimal form.
+
+    A plain astype(float64) turns 123.4 into 123.40000152587891, which bloats the JSON
+    payloads; rounding to the fewest significant digits (7, else 8, else 9) that still
+    map back to the same float32 keeps the value the sensor actually reported.
+    """
+    float32_cols = [col for col in df.columns if df[col].dtype == np.float32]
+    if not float32_cols:
+        return df
+    # Shallow copy: each widened column is a fresh array, the caller's frame is never written to
+    df = df.copy(deep=False)
+    for col in float32_cols:
+        values = df[col].to_numpy()
+        widened = _round_significant(values, 7)
+        for digits in (8, 9):
+            # 9 significant digits always round-trip a float32
+            inexact = (widened.astype(np.float32) != values) & np.isfinite(values)
+            if not inexact.any():
+                break
+            widened[inexact] = _round_significant(values[inexact], digits)
+        df[col] = widened
+    return df
+
+
+@lru_cache(maxsize=4096)
+def _format_lap_time_cached(seconds: float) -> str:
+    """MM:SS.mmm, memoized: the same best/avg/golden times are formatted for every response"""
+    minutes = int(seconds // 60)
+    secs = seconds % 60
+    return f"{minutes}:{secs:06.3f}"
+
+
+def _estimate_bytes(value) -> int:
+    """Approximate in-memory size of a cached value"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict) and value and all(isinstance(v, np.ndarray) for v in value.values()):
+        return sys.getsizeof(value) + sum(v.nbytes for v in value.values())
+    if isinstance(value, (list, tuple, set, frozenset, dict)):
+        # Conteneurs de petits objets (dicts de laps, clés) : estimation grossière par élément
+        return sys.getsizeof(value) + 128 * len(value)
+    return sys.getsizeof(value)
+
+
+# Sentinel for cache lookups: None is a legitimate cached value (missing results/weather file)
+_MISSING = object()
+
+
+class _CacheBudget:
+    """Byte budget shared by several _LRUCache: the least recently used entry across all of them goes first"""
+
+    def __init__(self, max_bytes: int = 2 << 30):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        # (cache, key) -> size, oldest first
+        self._recency = OrderedDict()
+        self._lock = threading.Lock()
+
+
+class _LRUCache:
+    """Dict-like cache whose entries count against a (shared) _CacheBudget"""
+
+    def __init__(self, budget: _CacheBudget):
+        self._budget = budget
+        self._entries = {}
+
+    def __contains__(self, key: str) -> bool:
+        with self._budget._lock:
+            return key in self._entries
+
+    def __getitem__(self, key: str):
+        # Check + read under one lock; callers racing other threads should prefer get()
+        with self._budget._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._budget._recency.move_to_end((self, key))
+            return self._entries[key]
+
+    def __setitem__(self, key: str, value):
+        size = _estimate_bytes(value)
+        budget = self._budget
+        with budget._lock:
+            if key in self._entries:
+                budget.total_bytes -= budget._recency.pop((self, key))
+            self._entries[key] = value
+            budget._recency[(self, key)] = size
+            budget.total_bytes += size
+            # Never evict the entry just stored, even if it alone exceeds the budget
+            while budget.total_bytes > budget.max_bytes and len(budget._recency) > 1:
+                (owner, old_key), old_size = budget._recency.popitem(last=False)
+                del owner._entries[old_key]
+                budget.total_bytes -= old_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default=None):
+        with self._budget._lock:
+            if key not in self._entries:
+                return default
+            self._budget._recency.move_to_end((self, key))
+            return self._entries[key]
+
+    def clear(self):
+        budget = self._budget
+        with budget._lock:
+            for key in self._entries:
+                budget.total_bytes -= budget._recency.pop((self, key))
+            self._entries.clear()
+
+
+def convert_csv_file(csv_path: Path, sort_by_lap: bool = False):
+    """Convert a CSV to Parquet in place (module-level so worker processes can run it)"""
+    parquet_path = csv_path.with_suffix('.parquet')
+
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        print(f"   ↪ {csv_path.name} already converted. Removing CSV copy.")
+        try:
+            csv_path.unlink()
+        except OSError as exc:
+            print(f"     ⚠️  Could not remove {csv_path.name}: {exc}")
+        return
+
+    temp_path = parquet_path.parent / f".{parquet_path.name}.tmp"
+    sorted_path = parquet_path.parent / f".{parquet_path.name}.sorted.tmp"
+    total_rows = 0
+    writer = None
+
+    print(f"   → Converting {csv_path.name} → {parquet_path.name}")
+    try:
+        # Lecture CSV native Arrow : les blocs arrivent directement en colonnes, sans passer par pandas
+        reader = pacsv.open_csv(csv_path, read_options=pacsv.ReadOptions(block_size=64 << 20))
+        for batch in reader:
+            table = pa.Table.from_batches([batch])
+            if writer is None:
+                writer = pq.ParquetWriter(temp_path, table.schema, **PARQUET_WRITE_OPTIONS)
+            writer.write_table(table)
+            total_rows += batch.num_rows
+
+        if writer is None:
+            pq.write_table(reader.schema.empty_table(), temp_path, **PARQUET_WRITE_OPTIONS)
+        else:
+            writer.close()
+            writer = None
+
+            if sort_by_lap and 'lap' in reader.schema.names:
+                print(f"   ↕ Sorting {parquet_path.name} by lap")
+                _sort_parquet_by_lap(temp_path, sorted_path, csv_path.stat().st_size / total_rows)
+                sorted_path.replace(temp_path)
+
+        temp_path.replace(parquet_path)
+        csv_path.unlink()
+        print(f"   ✅ {csv_path.name}: {total_rows:,} rows converted")
+    except Exception as exc:
+        print(f"   ❌ Conversion failed for {csv_path.name}: {exc}")
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+        for path in (temp_path, sorted_path):
+            if path.exists():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
 class RaceDataProcessor:
     FILE_PATTERNS = {
         "telemetry": [r"telemetry"],
@@ -17,6 +292,19 @@ class RaceDataProcessor:
     }
     AUTO_CONVERT_KEYS = ("telemetry", "lap_time", "lap_start", "lap_end")
     AUTO_CONVERT_KEYWORDS = AUTO_CONVERT_KEYS
+    # Long-format telemetry columns actually used by _process_telemetry
+    TELEMETRY_COLUMNS = ("timestamp", "lap", "vehicle_id", "chassis", "car_number", "telemetry_name", "telemetry_value")
+    # Telemetry channels stored as float32 once in wide format
+    FLOAT32_COLUMNS = ("Speed", "aps", "pbrake_f", "Laptrigger_lapdist_dls")
+    # Same fields as vehicle_id.split('-')[1] / [2]
+    VEHICLE_ID_PATTERN = r'^[^-]*-(?P<chassis>[^-]*)-(?P<car_number>[^-]*)'
+    # Columns actually used by the results / weather summaries (weather names compared stripped + upper-cased)
+    RESULTS_COLUMNS = ("POS", "NUMBER", "LAPS", "ELAPSED", "GAP_FIRST", "BEST_LAP_TIME", "BEST_LAP_KPH", "CLASS_TYPE", "CLASS", "CLASS NAME")
+    WEATHER_COLUMNS = ("AIR_TEMP", "TRACK_TEMP", "HUMIDITY", "PRESSURE", "WIND_SPEED", "WIND_DIRECTION", "RAIN")
+    # Low-cardinality string keys, kept as pandas categoricals (int codes) for the reshape
+    CATEGORICAL_COLUMNS = ("telemetry_name", "vehicle_id", "chassis")
+    # Hot-zone sector speed variance -> rating: first upper bound that fits, else 'weak'
+    VARIANCE_RATINGS = ((1.5, "excellent"), (3.5, "good"), (7.0, "ok"))
 
     def __init__(self, data_path: str = None):
         """Initialize processor with data path"""
@@ -24,13 +312,23 @@ class RaceDataProcessor:
             data_path = os.getenv("DATA_PATH", "../data")
         
         self.data_path = Path(data_path)
-        self.telemetry_cache = {}
-        self.lap_times_cache = {}
-        self.lap_events_cache = {}
-        self.vehicles_cache = {}
-        self.golden_laps = {}
-        self.race_results_cache = {}
-        self.weather_cache = {}
+        # One budget for every cache below, so CACHE_MAX_BYTES bounds the whole processor
+        self.cache_budget = _CacheBudget(CACHE_MAX_BYTES)
+        self.telemetry_cache = _LRUCache(self.cache_budget)
+        self.lap_times_cache = _LRUCache(self.cache_budget)
+        self.lap_events_cache = _LRUCache(self.cache_budget)
+        self.vehicles_cache = _LRUCache(self.cache_budget)
+        self.golden_laps = _LRUCache(self.cache_budget)
+        self.race_results_cache = _LRUCache(self.cache_budget)
+        self.weather_cache = _LRUCache(self.cache_budget)
+        self.lap_keys_cache = _LRUCache(self.cache_budget)
+        self.cache_version = 0
+        # str(directory) -> (mtime_ns, file names, subdirectory names), refreshed when the directory changes
+        self._dir_index: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self._compiled_patterns = {
+            key: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for key, patterns in self.FILE_PATTERNS.items()
+        }
         
         print(f"📁 Data path: {self.data_path.absolute()}")
         self._bootstrap_data()
@@ -47,89 +345,105 @@ class RaceDataProcessor:
             self._convert_csv_directory(circuit_dir)
 
     def _get_patterns(self, key: str):
-        return self.FILE_PATTERNS.get(key, [key])
+        patterns = self._compiled_patterns.get(key)
+        if patterns is None:
+            # Mots-clés hors FILE_PATTERNS : le mot-clé sert de regex, compilé une seule fois
+            patterns = [re.compile(key, re.IGNORECASE)]
+            self._compiled_patterns[key] = patterns
+        return patterns
 
     def _matches_patterns(self, name: str, patterns) -> bool:
-        return any(re.search(pattern, name, re.IGNORECASE) for pattern in patterns)
+        return any(pattern.search(name) for pattern in patterns)
 
     def _should_convert_file(self, filename: str) -> bool:
         return any(self._matches_patterns(filename, self._get_patterns(key)) for key in self.AUTO_CONVERT_KEYS)
 
     def _convert_csv_directory(self, circuit_dir: Path):
-        csv_files = [
-            path for path in circuit_dir.iterdir()
-            if path.is_file() and path.suffix.lower() == '.csv' and self._should_convert_file(path.name)
-        ]
+        # Un seul passage scandir : type et mtime viennent des DirEntry, regex seulement sur les .csv
+        with os.scandir(circuit_dir) as it:
+            entries = [entry for entry in it if entry.is_file(follow_symlinks=False)]
+        parquet_mtimes = {
+            Path(entry.name).stem: entry.stat().st_mtime
+            for entry in entries if entry.name.endswith('.parquet')
+        }
+
+        csv_files = []
+        for entry in entries:
+            if not entry.name.lower().endswith('.csv') or not self._should_convert_file(entry.name):
+                continue
+            csv_path = Path(entry.path)
+            parquet_mtime = parquet_mtimes.get(csv_path.stem)
+            if parquet_mtime is not None and parquet_mtime >= entry.stat().st_mtime:
+                print(f"   ↪ {entry.name} already converted. Removing CSV copy.")
+                try:
+                    csv_path.unlink()
+                except OSError as exc:
+                    print(f"     ⚠️  Could not remove {entry.name}: {exc}")
+                continue
+            csv_files.append(csv_path)
 
         if not csv_files:
             return
 
         print(f"🛠️  Preparing {circuit_dir.name}: {len(csv_files)} CSV file(s) to convert")
-        for csv_file in sorted(csv_files):
-            try:
-                self._convert_csv_file(csv_file)
-            except Exception as exc:
-                print(f"   ⚠️  Failed to convert {csv_file.name}: {exc}")
-
-    def _convert_csv_file(self, csv_path: Path):
-        parquet_path = csv_path.with_suffix('.parquet')
-
-        if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
-            print(f"   ↪ {csv_path.name} already converted. Removing CSV copy.")
-            try:
-                csv_path.unlink()
-            except OSError as exc:
-                print(f"     ⚠️  Could not remove {csv_path.name}: {exc}")
+        csv_files = sorted(csv_files)
+        max_workers = min(len(csv_files), os.cpu_count() or 1)
+        mp_context = self._conversion_mp_context()
+        if max_workers < 2 or mp_context is None:
+            for csv_file in csv_files:
+                try:
+                    self._convert_csv_file(csv_file, self._is_telemetry_file(csv_file.name))
+                except Exception as exc:
+                    print(f"   ⚠️  Failed to convert {csv_file.name}: {exc}")
             return
 
-        temp_path = parquet_path.parent / f".{parquet_path.name}.tmp"
-        chunk_size = 250_000
-        total_rows = 0
-        writer = None
+        # Les fichiers sont indépendants et la conversion est CPU-bound : un process par fichier
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            futures = {
+                executor.submit(convert_csv_file, csv_file, self._is_telemetry_file(csv_file.name)): csv_file
+                for csv_file in csv_files
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:
+                    print(f"   ⚠️  Failed to convert {futures[future].name}: {exc}")
+
+    def _conversion_mp_context(self):
+        # Only fork: spawn/forkserver workers re-import services, whose global
+        # processor would bootstrap (and convert) again in every worker.
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return None
+        return multiprocessing.get_context("fork")
 
-        print(f"   → Converting {csv_path.name} → {parquet_path.name}")
-        try:
-            for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
-                table = pa.Table.from_pandas(chunk, preserve_index=False)
-                if writer is None:
-                    writer = pq.ParquetWriter(temp_path, table.schema, compression='snappy')
-                writer.write_table(table)
-                total_rows += len(chunk)
+    def _convert_csv_file(self, csv_path: Path, sort_by_lap: bool = False):
+        convert_csv_file(csv_path, sort_by_lap)
 
-            if writer is None:
-                pq.write_table(
-                    pa.Table.from_pandas(pd.DataFrame()),
-                    temp_path,
-                    compression='snappy'
-                )
-            else:
-                writer.close()
-                writer = None
-
-            temp_path.replace(parquet_path)
-            csv_path.unlink()
-            print(f"   ✅ {csv_path.name}: {total_rows:,} rows converted")
-        except Exception as exc:
-            print(f"   ❌ Conversion failed for {csv_path.name}: {exc}")
-            raise
-        finally:
-            if writer is not None:
-                writer.close()
-            if temp_path.exists():
-                try:
-                    temp_path.unlink()
-                except OSError:
-                    pass
+    def _is_telemetry_file(self, filename: str) -> bool:
+        return self._matches_patterns(filename, self._get_patterns("telemetry"))
 
     def _load_lap_events(self, circuit: str, race: str) -> pd.DataFrame:
         cache_key = f"{circuit}_{race}_lap_events"
-        if cache_key in self.lap_events_cache:
-            return self.lap_events_cache[cache_key]
+        cached = self.lap_events_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         lap_file = self._find_data_file(circuit, race, "lap_time", prefer_parquet=True)
         if lap_file is None:
             raise FileNotFoundError(f"Lap time file not found for {circuit} {race}")
 
+        sidecar = self._lap_events_sidecar(lap_file)
+        if sidecar.exists():
+            try:
+                df = pd.read_parquet(sidecar)
+            except Exception as exc:
+                # Sidecar tronqué/corrompu (process tué en pleine écriture) : on le jette et on reparse
+                print(f"  ⚠️  Discarding unreadable lap events cache {sidecar.name}: {exc}")
+                sidecar.unlink(missing_ok=True)
+            else:
+                self.lap_events_cache[cache_key] = df
+                return df
+
         if lap_file.suffix.lower() == '.parquet':
             df = pd.read_parquet(lap_file)
         else:
@@ -147,8 +461,7 @@ class RaceDataProcessor:
         if 'vehicle_id' not in df.columns:
             raise ValueError(f"No vehicle_id column found in {lap_file}")
 
-        df['chassis'] = df['vehicle_id'].str.split('-').str[1]
-        df['car_number'] = df['vehicle_id'].str.split('-').str[2].astype(int)
+        df['chassis'], df['car_number'] = self._split_vehicle_id(df['vehicle_id'])
 
         if 'lap' in df.columns:
             df['lap'] = pd.to_numeric(df['lap'], errors='coerce').fillna(0).astype(int)
@@ -159,70 +472,140 @@ class RaceDataProcessor:
             df['lap'] = 0
 
         df = df[['timestamp', 'vehicle_id', 'chassis', 'car_number', 'lap']].copy()
+        self._write_lap_events_sidecar(sidecar, df)
         self.lap_events_cache[cache_key] = df
         return df
+
+    def _lap_events_sidecar(self, lap_file: Path) -> Path:
+        # mtime dans le nom : un fichier source modifié invalide le sidecar automatiquement
+        mtime_ns = lap_file.stat().st_mtime_ns
+        return lap_file.parent / ".cache" / f"{lap_file.stem}.lapevents.{mtime_ns}.parquet"
+
+    def _write_lap_events_sidecar(self, sidecar: Path, df: pd.DataFrame):
+        """Persist processed lap events so the next cold start skips the parse/split"""
+        # Per-writer temp name: two cold requests for the same race may write concurrently
+        temp_path = sidecar.parent / f".{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            sidecar.parent.mkdir(exist_ok=True)
+            for stale in sidecar.parent.glob(f"{sidecar.name.split('.lapevents.')[0]}.lapevents.*.parquet"):
+                if stale != sidecar:
+                    stale.unlink(missing_ok=True)
+            df.to_parquet(temp_path, compression='zstd')
+            temp_path.replace(sidecar)
+        except Exception as exc:
+            print(f"  ⚠️  Could not write lap events cache {sidecar.name}: {exc}")
+            try:
+                temp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
     
     def load_telemetry(self, circuit: str, race: str = "R1", vehicle_id: str = None, lap: int = None) -> pd.DataFrame:
         """Load telemetry - Parquet if available, CSV fallback"""
-        cache_key = f"{circuit}_{race}"
-        if vehicle_id:
-            cache_key += f"_{vehicle_id}"
-        if lap:
-            cache_key += f"_lap{lap}"
+        # Cached per race lap (or whole race) for every vehicle: vehicle_id is only a mask on top.
+        # lap=0 is a real lap filter, not "whole race".
+        cache_key = f"{circuit}_{race}_lap{lap}" if lap is not None else f"{circuit}_{race}"
         
-        # Check cache
-        if cache_key in self.telemetry_cache:
+        # Check cache (get(), not `in` + [], so a concurrent eviction can't slip in between)
+        df = self.telemetry_cache.get(cache_key)
+        if df is not None:
             print(f"✅ Loaded from cache: {cache_key}")
-            return self.telemetry_cache[cache_key]
-        
-        data_file = self._find_data_file(circuit, race, "telemetry", prefer_parquet=True)
-        if not data_file:
-            raise FileNotFoundError(f"No telemetry data found for {circuit} {race}")
-        
-        if data_file.suffix.lower() == '.parquet':
-            df = self._load_from_parquet(data_file, vehicle_id, lap)
         else:
-            print("⚠️  Telemetry Parquet not found, using CSV (slower)")
-            df = self._load_from_csv(data_file, vehicle_id, lap)
-        
-        if len(df) == 0:
-            return pd.DataFrame()
-        
-        # Process data
-        df = self._process_telemetry(df)
+            data_file = self._find_data_file(circuit, race, "telemetry", prefer_parquet=True)
+            if not data_file:
+                raise FileNotFoundError(f"No telemetry data found for {circuit} {race}")
+            
+            if data_file.suffix.lower() == '.parquet':
+                df = self._load_from_parquet(data_file, lap=lap)
+            else:
+                print("⚠️  Telemetry Parquet not found, using CSV (slower)")
+                df = self._load_from_csv(data_file, lap=lap)
+            
+            if len(df) == 0:
+                return pd.DataFrame()
+            
+            # Process data
+            df = self._process_telemetry(df)
+            
+            # Cache
+            self.telemetry_cache[cache_key] = df
         
-        # Cache
-        self.telemetry_cache[cache_key] = df
+        if vehicle_id:
+            df = df[df['vehicle_id'].to_numpy() == vehicle_id].reset_index(drop=True)
         
         return df
 
-    def _load_from_parquet(self, file_path: Path, vehicle_id: str = None, lap: int = None) -> pd.DataFrame:
+    def _load_from_parquet(
+        self,
+        file_path: Path,
+        vehicle_id: str = None,
+        lap: int = None,
+        use_post_filter: bool = True
+    ) -> pd.DataFrame:
         """Load from Parquet with predicate pushdown"""
         import time
         start = time.time()
         
         print(f"📊 Loading telemetry (Parquet): {file_path.name}")
         
-        # Build filters - SEULEMENT lap, pas vehicle_id
-        filters = []
-        if lap is not None:
-            filters.append(('lap', '==', lap))
-        
         # Ne PAS filtrer par vehicle_id car le format exact peut varier
         # On filtrera après par chassis/car_number
         
-        # Load with filters
-        df = pd.read_parquet(
-            file_path,
-            engine='pyarrow',
-            filters=filters if filters else None
-        )
+        parquet_file = pq.ParquetFile(file_path)
+        
+        # Project only the used columns so the other column chunks are never decoded
+        available = set(parquet_file.schema_arrow.names)
+        columns = [col for col in self.TELEMETRY_COLUMNS if col in available]
+        # Parquet dictionary pages map straight onto pandas categoricals, no re-hashing
+        categories = [col for col in self.CATEGORICAL_COLUMNS if col in columns]
+        
+        if lap is not None and use_post_filter:
+            # Prune row groups on lap min/max stats, then match rows with a NumPy mask:
+            # cheaper than pyarrow's row-level predicate evaluation during the read
+            row_groups = self._row_groups_for_value(parquet_file, 'lap', lap)
+            table = parquet_file.read_row_groups(row_groups, columns=columns, use_threads=True)
+            table = self._parse_timestamp_column(table)
+            df = table.to_pandas(categories=categories, split_blocks=True, self_destruct=True)
+            del table
+            df = df[df['lap'].to_numpy() == lap].reset_index(drop=True)
+        else:
+            # Build filters - SEULEMENT lap, pas vehicle_id
+            filters = [('lap', '==', lap)] if lap is not None else None
+            table = pq.read_table(file_path, columns=columns, filters=filters, use_threads=True)
+            table = self._parse_timestamp_column(table)
+            df = table.to_pandas(categories=categories, split_blocks=True, self_destruct=True)
+            del table
         
         elapsed = time.time() - start
         print(f"  → {len(df):,} measurements in {elapsed:.2f}s ⚡")
         
         return df
 
+    def _parse_timestamp_column(self, table: pa.Table) -> pa.Table:
+        """Parse ISO string timestamps in Arrow, so pandas hashes int64 instead of strings in the reshape"""
+        index = table.schema.get_field_index('timestamp')
+        if index < 0:
+            return table
+        column_type = table.schema.field(index).type
+        if not (pa.types.is_string(column_type) or pa.types.is_large_string(column_type)):
+            return table
+        try:
+            parsed = pc.cast(table.column(index), pa.timestamp('ns', tz='UTC'))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # Format non ISO / sans fuseau : pd.to_datetime s'en chargera après le reshape
+            return table
+        return table.set_column(index, 'timestamp', parsed)
+
+    def _row_groups_for_value(self, parquet_file: pq.ParquetFile, column: str, value) -> List[int]:
+        """Row groups whose min/max statistics may contain value (all groups when stats are missing)."""
+        metadata = parquet_file.metadata
+        column_index = parquet_file.schema.names.index(column)
+        row_groups = []
+        for idx in range(metadata.num_row_groups):
+            stats = metadata.row_group(idx).column(column_index).statistics
+            if stats is None or not stats.has_min_max or stats.min <= value <= stats.max:
+                row_groups.append(idx)
+        return row_groups
+
     def _load_from_csv(self, file_path: Path, vehicle_id: str = None, lap: int = None) -> pd.DataFrame:
         """Load from CSV with chunked filtering"""
         import time
@@ -256,22 +639,35 @@ class RaceDataProcessor:
         """Process raw telemetry to wide format"""
         
         # Extract vehicle info if not present
-        if 'chassis' not in df.columns:
-            df['chassis'] = df['vehicle_id'].str.split('-').str[1]
-        if 'car_number' not in df.columns:
-            df['car_number'] = df['vehicle_id'].str.split('-').str[2].astype(int)
+        if 'chassis' not in df.columns or 'car_number' not in df.columns:
+            chassis, car_number = self._split_vehicle_id(df['vehicle_id'])
+            if 'chassis' not in df.columns:
+                df['chassis'] = chassis
+            if 'car_number' not in df.columns:
+                df['car_number'] = car_number
+        for col in self.CATEGORICAL_COLUMNS:
+            df[col] = self._as_sorted_category(df[col])
         
         # Pivot to wide format
         print("🔄 Transforming to wide format...")
-        df_wide = df.pivot_table(
-            index=['timestamp', 'lap', 'vehicle_id', 'chassis', 'car_number'],
-            columns='telemetry_name',
-            values='telemetry_value',
-            aggfunc='first'
-        ).reset_index()
+        # Long-to-wide reshape: drop_duplicates + unstack instead of pivot_table('first'),
+        # which goes through the generic aggregation path. Null values/keys are dropped
+        # first to keep pivot_table's "first non-null" semantics.
+        index_cols = ['timestamp', 'lap', 'vehicle_id', 'chassis', 'car_number']
+        df_wide = (
+            df.dropna(subset=index_cols + ['telemetry_name', 'telemetry_value'])
+            .drop_duplicates(subset=['timestamp', 'lap', 'vehicle_id', 'telemetry_name'], keep='first')
+            .set_index(index_cols + ['telemetry_name'])['telemetry_value']
+            .unstack('telemetry_name')
+        )
+        # Only channels present in this slice become columns (like pivot_table)
+        df_wide = df_wide.loc[:, df_wide.notna().any()]
+        df_wide.columns = df_wide.columns.astype(str)
+        df_wide = df_wide.reset_index()
         
         df_wide.columns.name = None
-        df_wide['timestamp'] = pd.to_datetime(df_wide['timestamp'])
+        if not pd.api.types.is_datetime64_any_dtype(df_wide['timestamp']):
+            df_wide['timestamp'] = pd.to_datetime(df_wide['timestamp'])
         df_wide = df_wide.sort_values(['vehicle_id', 'lap', 'timestamp']).reset_index(drop=True)
         
         print(f"  ✅ {len(df_wide):,} telemetry points")
@@ -285,36 +681,70 @@ class RaceDataProcessor:
 
         df_wide = self._normalize_telemetry_columns(df_wide)
         df_wide = self._ensure_distance_column(df_wide)
+        df_wide = self._downcast_telemetry(df_wide)
 
         return df_wide
+
+    def _downcast_telemetry(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink the hot columns: float32 channels, int32 lap, int16 car number"""
+        for col in self.FLOAT32_COLUMNS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+        # int32 et pas int16 : les laps bruts montent à 32768 (bit 0x8000) avant masquage
+        df['lap'] = df['lap'].astype('int32')
+        df['car_number'] = df['car_number'].astype('int16')
+        return df
     
+    def _split_vehicle_id(self, vehicle_ids: pd.Series):
+        """GR86-<chassis>-<car_number> -> (chassis, car_number) arrays, parsed once per distinct id"""
+        codes, uniques = pd.factorize(vehicle_ids)
+        if (codes < 0).any():
+            raise ValueError("vehicle_id contains missing values")
+        parts = pd.Series(uniques, dtype=object).str.extract(self.VEHICLE_ID_PATTERN)
+        chassis = parts['chassis'].to_numpy()[codes]
+        car_number = parts['car_number'].astype(int).to_numpy()[codes]
+        return chassis, car_number
+
+    def _as_sorted_category(self, series: pd.Series) -> pd.Series:
+        """Categorical with lexically sorted categories, so sorts/unstack keep string order."""
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype('category')
+        series = series.cat.remove_unused_categories()
+        categories = series.cat.categories
+        if categories.is_monotonic_increasing:
+            return series
+        return series.cat.reorder_categories(categories.sort_values())
+
     def _calculate_speed_from_gps(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate speed from GPS coordinates if not available"""
-        from math import radians, cos, sin, asin, sqrt
-        
-        def haversine(lon1, lat1, lon2, lat2):
-            if pd.isna(lon1) or pd.isna(lat1) or pd.isna(lon2) or pd.isna(lat2):
-                return 0
-            lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-            dlon = lon2 - lon1
-            dlat = lat2 - lat1
-            a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-            c = 2 * asin(sqrt(a))
-            return c * 6371000
-        
         df = df.copy()
-        df['prev_lon'] = df.groupby('vehicle_id')['VBOX_Long_Minutes'].shift(1)
-        df['prev_lat'] = df.groupby('vehicle_id')['VBOX_Lat_Min'].shift(1)
-        df['prev_time'] = df.groupby('vehicle_id')['timestamp'].shift(1)
-        
-        df['distance_m'] = df.apply(
-            lambda row: haversine(
-                row['prev_lon'], row['prev_lat'],
-                row['VBOX_Long_Minutes'], row['VBOX_Lat_Min']
-            ), axis=1
-        )
+        df['prev_lon'] = df.groupby('vehicle_id', observed=True)['VBOX_Long_Minutes'].shift(1)
+        df['prev_lat'] = df.groupby('vehicle_id', observed=True)['VBOX_Lat_Min'].shift(1)
+        df['prev_time'] = df.groupby('vehicle_id', observed=True)['timestamp'].shift(1)
         
         df['time_delta'] = (df['timestamp'] - df['prev_time']).dt.total_seconds()
+        
+        if _haversine_speed_kernel is not None:
+            speed = np.empty(len(df), dtype=np.float64)
+            _haversine_speed_kernel(
+                df['prev_lon'].to_numpy(dtype=float),
+                df['prev_lat'].to_numpy(dtype=float),
+                df['VBOX_Long_Minutes'].to_numpy(dtype=float),
+                df['VBOX_Lat_Min'].to_numpy(dtype=float),
+                df['time_delta'].to_numpy(dtype=float),
+                speed,
+            )
+            df['Speed'] = speed
+            return df.drop(['prev_lon', 'prev_lat', 'prev_time', 'time_delta'], axis=1)
+        
+        # Vectorized haversine over the whole frame; rows with a missing coordinate get 0
+        lon1 = np.radians(df['prev_lon'].to_numpy(dtype=float))
+        lat1 = np.radians(df['prev_lat'].to_numpy(dtype=float))
+        lon2 = np.radians(df['VBOX_Long_Minutes'].to_numpy(dtype=float))
+        lat2 = np.radians(df['VBOX_Lat_Min'].to_numpy(dtype=float))
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        df['distance_m'] = np.where(np.isnan(a), 0.0, 2 * 6371000 * np.arcsin(np.sqrt(a)))
+        
         df['Speed'] = np.where(
             df['time_delta'] > 0,
             (df['distance_m'] / df['time_delta']) * 3.6,
@@ -349,19 +779,36 @@ class RaceDataProcessor:
 
         print("  ⚠️  Distance column missing; integrating speed to estimate Laptrigger_lapdist_dls")
         df = df.sort_values(['vehicle_id', 'lap', 'timestamp']).copy()
-        df['__delta_t'] = df.groupby(['vehicle_id', 'lap'])['timestamp'].diff().dt.total_seconds().fillna(0)
-        df['__delta_t'] = df['__delta_t'].clip(lower=0)
-        df[target_col] = (df['Speed'] / 3.6) * df['__delta_t']
-        df[target_col] = df.groupby(['vehicle_id', 'lap'])[target_col].cumsum()
-        df.drop(columns=['__delta_t'], inplace=True, errors='ignore')
+
+        # Rows are sorted, so each (vehicle_id, lap) group is a contiguous segment:
+        # segmented diff/cumsum in NumPy instead of two hashed groupbys
+        vehicle_codes = pd.factorize(df['vehicle_id'])[0]
+        laps = df['lap'].to_numpy()
+        starts = np.ones(len(df), dtype=bool)
+        starts[1:] = (vehicle_codes[1:] != vehicle_codes[:-1]) | (laps[1:] != laps[:-1])
+
+        delta_t = np.zeros(len(df))
+        delta_t[1:] = np.diff(df['timestamp'].to_numpy()) / np.timedelta64(1, 's')
+        delta_t[starts | np.isnan(delta_t)] = 0
+        delta_t = np.clip(delta_t, 0, None)
+
+        step = (df['Speed'].to_numpy(dtype=float) / 3.6) * delta_t
+        missing = np.isnan(step)
+        running = np.cumsum(np.where(missing, 0.0, step))
+        segment_ids = np.cumsum(starts) - 1
+        segment_offsets = running[starts] - np.where(missing, 0.0, step)[starts]
+        distance = running - segment_offsets[segment_ids]
+        distance[missing] = np.nan  # comme groupby.cumsum : NaN reste NaN, la somme continue
+        df[target_col] = distance
         return df
     
     def calculate_lap_times(self, circuit: str, race: str = "R1") -> pd.DataFrame:
         """Calculate lap times from lap_time.csv (contains only timestamps)"""
         cache_key = f"{circuit}_{race}_laptimes"
         
-        if cache_key in self.lap_times_cache:
-            return self.lap_times_cache[cache_key]
+        cached = self.lap_times_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
         lap_events = self._load_lap_events(circuit, race).copy()
 
@@ -383,8 +830,9 @@ class RaceDataProcessor:
         """Find the fastest lap (golden lap)"""
         cache_key = f"{circuit}_{race}"
         
-        if cache_key in self.golden_laps:
-            return self.golden_laps[cache_key]
+        cached = self.golden_laps.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
         
         lap_times = self.calculate_lap_times(circuit, race)
         
@@ -392,18 +840,25 @@ class RaceDataProcessor:
             raise ValueError("No valid lap times found")
         
         lap_candidates = lap_times.sort_values('lap_time').reset_index(drop=True)
+        available_keys = None
         golden_row = None
-        for _, candidate in lap_candidates.iterrows():
-            lap_number = int(candidate['lap'])
+        for candidate in lap_candidates[['lap', 'chassis', 'car_number', 'lap_time']].itertuples(index=False):
+            # The fastest lap usually has telemetry; once it misses, one projected scan
+            # lists every (chassis, car, lap) so later candidates skip lap loads entirely
+            if available_keys is not None:
+                if (candidate.chassis, int(candidate.car_number), int(candidate.lap)) not in available_keys:
+                    continue
             if self._lap_has_telemetry(
                 circuit,
-                candidate['chassis'],
-                int(candidate['car_number']),
-                lap_number,
+                candidate.chassis,
+                int(candidate.car_number),
+                int(candidate.lap),
                 race
             ):
                 golden_row = candidate
                 break
+            if available_keys is None:
+                available_keys = self._available_lap_keys(circuit, race)
 
         if golden_row is None:
             raise ValueError("No lap with telemetry available for golden comparison")
@@ -411,11 +866,11 @@ class RaceDataProcessor:
         golden_lap = {
             'circuit': circuit,
             'race': race,
-            'chassis': golden_row['chassis'],
-            'car_number': int(golden_row['car_number']),
-            'lap': int(golden_row['lap']),
-            'time': float(golden_row['lap_time']),
-            'formatted_time': self._format_lap_time(golden_row['lap_time'])
+            'chassis': golden_row.chassis,
+            'car_number': int(golden_row.car_number),
+            'lap': int(golden_row.lap),
+            'time': float(golden_row.lap_time),
+            'formatted_time': self._format_lap_time(golden_row.lap_time)
         }
         
         print(f"\n🏆 GOLDEN LAP FOUND")
@@ -431,8 +886,9 @@ class RaceDataProcessor:
     def get_vehicles(self, circuit: str, race: str = "R1") -> List[Dict]:
         """Get list of vehicles - optimized to read only necessary data"""
         cache_key = f"{circuit}_{race}_vehicles"
-        if cache_key in self.vehicles_cache:
-            return self.vehicles_cache[cache_key]
+        cached = self.vehicles_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         lap_events = self._load_lap_events(circuit, race)
         if lap_events.empty:
@@ -461,22 +917,24 @@ class RaceDataProcessor:
         ].copy()
         
         vehicle_laps = vehicle_laps.sort_values('lap')
+        vehicle_laps['lap'] = vehicle_laps['lap'].astype(int)
+        vehicle_laps['lap_time'] = vehicle_laps['lap_time'].astype(float)
+        vehicle_laps['formatted_time'] = self._format_lap_times_vec(vehicle_laps['lap_time'].to_numpy())
         
-        laps = []
-        for _, row in vehicle_laps.iterrows():
-            laps.append({
-                'lap_number': int(row['lap']),
-                'lap_time': float(row['lap_time']),
-                'formatted_time': self._format_lap_time(row['lap_time'])
-            })
-        
-        return laps
+        return vehicle_laps[['lap', 'lap_time', 'formatted_time']].rename(
+            columns={'lap': 'lap_number'}
+        ).to_dict('records')
     
     def _format_lap_time(self, seconds: float) -> str:
         """Format lap time as MM:SS.mmm"""
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes}:{secs:06.3f}"
+        return _format_lap_time_cached(seconds)
+
+    def _format_lap_times_vec(self, seconds: np.ndarray) -> np.ndarray:
+        """Vectorized _format_lap_time: array of seconds -> array of MM:SS.mmm strings"""
+        seconds = np.asarray(seconds, dtype=float)
+        minutes = (seconds // 60).astype(np.int64)
+        secs = np.char.mod('%06.3f', seconds % 60)
+        return np.char.add(np.char.add(minutes.astype(str), ':'), secs)
     
     def get_lap_telemetry(self, circuit: str, chassis: str, car_number: int, lap: int, race: str = "R1") -> pd.DataFrame:
         """Extract telemetry for a specific lap - optimized"""
@@ -505,6 +963,33 @@ class RaceDataProcessor:
         
         return telemetry.sort_values('timestamp')
 
+    def _available_lap_keys(self, circuit: str, race: str) -> set:
+        """(chassis, car_number, lap) triples present in the telemetry file, from one projected scan"""
+        cache_key = f"{circuit}_{race}"
+        cached = self.lap_keys_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        data_file = self._find_data_file(circuit, race, "telemetry", prefer_parquet=True)
+        if not data_file:
+            return set()
+
+        if data_file.suffix.lower() == '.parquet':
+            pairs = (
+                pq.read_table(data_file, columns=['vehicle_id', 'lap'])
+                .group_by(['vehicle_id', 'lap'])
+                .aggregate([])
+                .to_pandas()
+            )
+        else:
+            pairs = pd.read_csv(data_file, usecols=['vehicle_id', 'lap']).drop_duplicates()
+        pairs = pairs.dropna()
+
+        chassis, car_number = self._split_vehicle_id(pairs['vehicle_id'])
+        keys = set(zip(chassis.tolist(), car_number.tolist(), pairs['lap'].astype(int).tolist()))
+        self.lap_keys_cache[cache_key] = keys
+        return keys
+
     def _lap_has_telemetry(self, circuit: str, chassis: str, car_number: int, lap: int, race: str) -> bool:
         try:
             telemetry = self.get_lap_telemetry(circuit, chassis, car_number, lap, race)
@@ -571,20 +1056,9 @@ class RaceDataProcessor:
         
         print(f"  After cleaning: User {len(user_clean)} points, Golden {len(golden_clean)} points")
         
-        # Divide into sectors
-        user_clean['sector'] = (user_clean['Laptrigger_lapdist_dls'] // sector_size).astype(int)
-        golden_clean['sector'] = (golden_clean['Laptrigger_lapdist_dls'] // sector_size).astype(int)
-        
-        # Aggregate by sector
-        agg_dict = {
-            'Speed': 'mean',
-            'Laptrigger_lapdist_dls': 'first',
-            'aps': 'mean',
-            'pbrake_f': 'max'
-        }
-        
-        user_sectors = user_clean.groupby('sector').agg(agg_dict).reset_index()
-        golden_sectors = golden_clean.groupby('sector').agg(agg_dict).reset_index()
+        # Divide into sectors and aggregate by sector
+        user_sectors = widen_float32(self._aggregate_sectors(user_clean, sector_size))
+        golden_sectors = widen_float32(self._aggregate_sectors(golden_clean, sector_size))
         
         # Merge
         comparison = user_sectors.merge(
@@ -607,7 +1081,7 @@ class RaceDataProcessor:
         
         # Generate recommendations
         recommendations = []
-        for _, sector in worst_3.iterrows():
+        for sector in worst_3.to_dict('records'):
             issue, suggestion = self._generate_recommendation(sector)
             
             recommendations.append({
@@ -650,10 +1124,10 @@ class RaceDataProcessor:
         user_cols = sample_base + [col for col in ['VBOX_Long_Minutes', 'VBOX_Lat_Min'] if col in user_clean.columns]
         golden_cols = sample_base + [col for col in ['VBOX_Long_Minutes', 'VBOX_Lat_Min'] if col in golden_clean.columns]
 
-        user_telemetry_sample = user_clean[user_cols].copy()
+        user_telemetry_sample = widen_float32(user_clean[user_cols])
         user_telemetry_sample['timestamp'] = user_clean['timestamp'].astype(str)
         
-        golden_telemetry_sample = golden_clean[golden_cols].copy()
+        golden_telemetry_sample = widen_float32(golden_clean[golden_cols])
         golden_telemetry_sample['timestamp'] = golden_clean['timestamp'].astype(str)
         
         print(f"  Telemetry to send: User {len(user_telemetry_sample)}, Golden {len(golden_telemetry_sample)}")
@@ -689,13 +1163,37 @@ class RaceDataProcessor:
             'race_timeline': race_timeline,
             'ghost_laps': ghost_laps,
             'telemetry': {
-                'user': user_telemetry_sample.to_dict('records'),
-                'golden': golden_telemetry_sample.to_dict('records')
+                'user': self._columnar(user_telemetry_sample),
+                'golden': self._columnar(golden_telemetry_sample)
             }
         }
-        return self._to_native(result)
+        return result
     
-    def _generate_recommendation(self, sector: pd.Series) -> tuple:
+    def _aggregate_sectors(self, df: pd.DataFrame, sector_size: int) -> pd.DataFrame:
+        """Per-sector Speed/aps mean, first distance and pbrake_f max.
+
+        Same result as groupby('sector').agg(...) on NaN-free columns, but sectors are
+        dense small integers: one stable argsort, then reduceat over contiguous runs.
+        """
+        distance = df['Laptrigger_lapdist_dls'].to_numpy()
+        sectors = (distance // sector_size).astype(np.int64)
+        order = np.argsort(sectors, kind='stable')
+        sorted_sectors = sectors[order]
+        starts = np.flatnonzero(np.r_[True, sorted_sectors[1:] != sorted_sectors[:-1]])
+        counts = np.diff(np.r_[starts, len(sorted_sectors)])
+
+        def column(name, dtype=None):
+            return df[name].to_numpy(dtype=dtype)[order]
+
+        return pd.DataFrame({
+            'sector': sorted_sectors[starts],
+            'Speed': np.add.reduceat(column('Speed', np.float64), starts) / counts,
+            'Laptrigger_lapdist_dls': distance[order][starts],
+            'aps': np.add.reduceat(column('aps', np.float64), starts) / counts,
+            'pbrake_f': np.maximum.reduceat(column('pbrake_f'), starts),
+        })
+
+    def _generate_recommendation(self, sector: Dict) -> tuple:
         """Generate issue and suggestion based on sector data"""
         
         # Vérifier si les colonnes existent
@@ -714,6 +1212,10 @@ class RaceDataProcessor:
         
         return issue, suggestion
 
+    def _columnar(self, df: pd.DataFrame) -> Dict[str, List]:
+        """Column-oriented payload {column: [values]}: no per-row dicts, keys sent once"""
+        return {col: df[col].to_list() for col in df.columns}
+
     def _serialize_lap_telemetry(self, df: pd.DataFrame, sample_size: int = 250) -> List[Dict[str, float]]:
         required_cols = ['Laptrigger_lapdist_dls', 'Speed', 'VBOX_Long_Minutes', 'VBOX_Lat_Min']
         if not all(col in df.columns for col in required_cols):
@@ -724,14 +1226,18 @@ class RaceDataProcessor:
         if len(clean) > sample_size:
             idx = np.linspace(0, len(clean) - 1, sample_size).astype(int)
             clean = clean.iloc[idx]
+        clean = widen_float32(clean)
+        has_timestamp = 'timestamp' in clean.columns
+        columns = required_cols + (['timestamp'] if has_timestamp else [])
         rows = []
-        for _, row in clean.iterrows():
+        # Bare tuples (positional, same order as columns) rather than one Series per row
+        for distance, speed, lon, lat, *timestamp in clean[columns].itertuples(index=False, name=None):
             rows.append({
-                'distance': float(row['Laptrigger_lapdist_dls']),
-                'speed': float(row['Speed']) if 'Speed' in row and not pd.isna(row['Speed']) else None,
-                'lon': float(row['VBOX_Long_Minutes']) if 'VBOX_Long_Minutes' in row and not pd.isna(row['VBOX_Long_Minutes']) else None,
-                'lat': float(row['VBOX_Lat_Min']) if 'VBOX_Lat_Min' in row and not pd.isna(row['VBOX_Lat_Min']) else None,
-                'timestamp': str(row['timestamp']) if 'timestamp' in row else None
+                'distance': float(distance),
+                'speed': float(speed) if not pd.isna(speed) else None,
+                'lon': float(lon) if not pd.isna(lon) else None,
+                'lat': float(lat) if not pd.isna(lat) else None,
+                'timestamp': str(timestamp[0]) if has_timestamp else None
             })
         return rows
 
@@ -749,21 +1255,22 @@ class RaceDataProcessor:
             return []
 
         lap_candidates = []
-        fastest = vehicle_history.dropna(subset=['lap_time']).sort_values('lap_time')
-        slowest = vehicle_history.dropna(subset=['lap_time']).sort_values('lap_time', ascending=False)
-        recent = vehicle_history.sort_values('lap', ascending=False)
+        # Only the first row of each ordering is used: partial selection, no full sorts
+        timed = vehicle_history.dropna(subset=['lap_time'])
+        fastest = timed.nsmallest(1, 'lap_time')
+        slowest = timed.nlargest(1, 'lap_time')
+        recent = vehicle_history.nlargest(1, 'lap')
 
         for label, df in [('Best Lap', fastest), ('Slowest Lap', slowest), ('Most Recent Lap', recent)]:
             if df.empty:
                 continue
-            lap_num = int(df.iloc[0]['lap'])
+            lap_num = int(df['lap'].iat[0])
             if lap_num != exclude_lap:
-                lap_candidates.append((label, df.iloc[0]))
+                lap_candidates.append((label, lap_num, df['lap_time'].iat[0]))
 
         ghosts = []
         seen = set()
-        for label, row in lap_candidates:
-            lap_num = int(row['lap'])
+        for label, lap_num, lap_time in lap_candidates:
             if lap_num in seen:
                 continue
             try:
@@ -776,7 +1283,7 @@ class RaceDataProcessor:
             ghosts.append({
                 'label': label,
                 'lap': lap_num,
-                'lap_time': self._format_lap_time(float(row['lap_time'])),
+                'lap_time': self._format_lap_time(float(lap_time)),
                 'telemetry': serialized
             })
             seen.add(lap_num)
@@ -799,80 +1306,83 @@ class RaceDataProcessor:
             (lap_times_df['car_number'] == golden_info['car_number'])
         ].sort_values('lap')
 
-        golden_lookup = {int(row['lap']): float(row['lap_time']) for _, row in golden_hist.iterrows()}
-        user_cum = 0.0
-        golden_cum = 0.0
-        timeline = []
-
-        for _, row in user_hist.iterrows():
-            lap_num = int(row['lap'])
-            lap_time = float(row['lap_time'])
-            user_cum += lap_time
-            golden_time = golden_lookup.get(lap_num)
-            if golden_time is not None:
-                golden_cum += golden_time
-                gap = user_cum - golden_cum
-            else:
-                gap = None
-            timeline.append({
-                'lap': lap_num,
+        # Un temps golden par tour (le dernier en cas de doublon), aligné sur les tours de l'utilisateur
+        golden_by_lap = golden_hist.drop_duplicates('lap', keep='last').set_index('lap')['lap_time']
+        laps = user_hist['lap'].to_numpy()
+        lap_times = user_hist['lap_time'].to_numpy(dtype=float)
+        has_golden = np.isin(laps, golden_by_lap.index.to_numpy())
+        golden_times = golden_by_lap.reindex(laps).to_numpy(dtype=float)
+
+        user_cum = np.cumsum(lap_times)
+        golden_cum = np.cumsum(np.where(has_golden, golden_times, 0.0))
+        gaps = np.where(has_golden, user_cum - golden_cum, None)
+
+        return [
+            {
+                'lap': int(lap_num),
                 'lap_time': lap_time,
-                'formatted': self._format_lap_time(lap_time),
-                'cumulative': user_cum,
+                'formatted': formatted,
+                'cumulative': cumulative,
                 'gap_to_golden': gap
-            })
+            }
+            for lap_num, lap_time, formatted, cumulative, gap in zip(
+                laps.tolist(),
+                lap_times.tolist(),
+                self._format_lap_times_vec(lap_times).tolist(),
+                user_cum.tolist(),
+                gaps.tolist()
+            )
+        ]
 
-        return timeline
     def _build_consistency_metrics(self, laps_df: pd.DataFrame) -> Optional[Dict]:
         if laps_df is None or len(laps_df) == 0:
             return None
 
         laps_df = laps_df.sort_values('lap')
-        times = laps_df['lap_time'].tolist()
-        if not times:
+        lap_times = laps_df['lap_time'].to_numpy(dtype=np.float64)
+        if not len(lap_times):
             return None
 
-        avg_time = float(np.mean(times))
-        std_dev = float(np.std(times)) if len(times) > 1 else 0.0
-        best_time = float(np.min(times))
-        worst_time = float(np.max(times))
+        avg_time = float(lap_times.mean())
+        std_dev = float(lap_times.std()) if len(lap_times) > 1 else 0.0
+        best_time = float(lap_times.min())
+        worst_time = float(lap_times.max())
         score = max(0.0, 100.0 - ((std_dev / avg_time) * 100.0 if avg_time else 0.0))
         threshold = std_dev * 2
-        outliers = []
-        lap_breakdown = []
-
-        for _, row in laps_df.iterrows():
-            lap_num = int(row['lap'])
-            lap_time = float(row['lap_time'])
-            delta = lap_time - avg_time
-
-            if std_dev > 0 and abs(delta) > threshold:
-                outliers.append(lap_num)
-
-            if lap_time == best_time:
-                status = "Personal best"
-                icon = "🏆"
-            elif lap_time == worst_time:
-                status = "Slowest lap"
-                icon = "❌"
-            elif delta < -std_dev * 0.5:
-                status = "Excellent push"
-                icon = "✅"
-            elif delta > std_dev * 1.5:
-                status = "Major drop"
-                icon = "⚠️"
-            else:
-                status = "Consistent"
-                icon = "✅"
+        lap_nums = laps_df['lap'].to_numpy(dtype=int)
+        deltas = lap_times - avg_time
+
+        outlier_mask = (np.abs(deltas) > threshold) if std_dev > 0 else np.zeros(len(deltas), dtype=bool)
+        outliers = lap_nums[outlier_mask].tolist()
+
+        # Premier cas vrai gagne, comme la chaîne if/elif
+        conditions = [
+            lap_times == best_time,
+            lap_times == worst_time,
+            deltas < -std_dev * 0.5,
+            deltas > std_dev * 1.5,
+        ]
+        statuses = np.select(conditions, ["Personal best", "Slowest lap", "Excellent push", "Major drop"], default="Consistent")
+        icons = np.select(conditions, ["🏆", "❌", "✅", "⚠️"], default="✅")
 
-            lap_breakdown.append({
+        lap_breakdown = [
+            {
                 'lap': lap_num,
                 'time': lap_time,
-                'formatted': self._format_lap_time(lap_time),
+                'formatted': formatted,
                 'delta_to_avg': delta,
                 'status': status,
                 'icon': icon
-            })
+            }
+            for lap_num, lap_time, formatted, delta, status, icon in zip(
+                lap_nums.tolist(),
+                lap_times.tolist(),
+                self._format_lap_times_vec(lap_times).tolist(),
+                deltas.tolist(),
+                statuses.tolist(),
+                icons.tolist()
+            )
+        ]
 
         recommendation = "Great consistency overall. Keep building rhythm."
         if outliers:
@@ -897,39 +1407,44 @@ class RaceDataProcessor:
             return None
 
         laps_df = laps_df.sort_values('lap')
-        times = laps_df['lap_time'].tolist()
-        if not times:
+        lap_times = laps_df['lap_time'].to_numpy(dtype=np.float64)
+        if not len(lap_times):
             return None
 
-        start_time = times[0]
-        best_time = float(np.min(times))
+        start_time = float(lap_times[0])
+        best_time = float(lap_times.min())
         total_improvement = start_time - best_time
-        lap_points = []
-        plateau_start = None
-        plateau_detected = None
-
-        for idx, row in enumerate(laps_df.itertuples()):
-            previous_time = times[idx - 1] if idx > 0 else None
-            lap_time = float(row.lap_time)
-            delta_prev = (previous_time - lap_time) if previous_time else 0.0
-            improvement_from_start = start_time - lap_time
-
-            if idx > 0:
-                if abs(delta_prev) < 0.1:
-                    plateau_start = plateau_start or row.lap
-                else:
-                    plateau_start = None
-
-            if plateau_start and abs(delta_prev) < 0.1:
-                plateau_detected = plateau_start
+        lap_nums = laps_df['lap'].to_numpy(dtype=int)
+        previous = lap_times[:-1]
+        delta_prev = np.concatenate(([0.0], np.where(previous != 0, previous - lap_times[1:], 0.0)))
+        improvement_from_start = start_time - lap_times
 
-            lap_points.append({
-                'lap': int(row.lap),
+        # Plateau : début de la dernière série de tours à moins de 0.1s du précédent
+        plateau_detected = None
+        flat = np.abs(delta_prev) < 0.1
+        flat[0] = False
+        flat_idx = np.flatnonzero(flat)
+        if len(flat_idx):
+            last_flat = flat_idx[-1]
+            run_start = np.flatnonzero(~flat[:last_flat + 1])[-1] + 1
+            plateau_detected = lap_nums[run_start]
+
+        lap_points = [
+            {
+                'lap': lap_num,
                 'time': lap_time,
-                'formatted': self._format_lap_time(lap_time),
-                'delta_prev': delta_prev,
-                'improvement_from_start': improvement_from_start
-            })
+                'formatted': formatted,
+                'delta_prev': delta,
+                'improvement_from_start': improvement
+            }
+            for lap_num, lap_time, formatted, delta, improvement in zip(
+                lap_nums.tolist(),
+                lap_times.tolist(),
+                self._format_lap_times_vec(lap_times).tolist(),
+                delta_prev.tolist(),
+                improvement_from_start.tolist()
+            )
+        ]
 
         insights = []
         if total_improvement > 0:
@@ -958,7 +1473,8 @@ class RaceDataProcessor:
             return None
 
         recent_laps = laps[-6:]
-        sector_speeds = {}
+        lap_sectors = []
+        lap_speeds = []
 
         for lap_num in recent_laps:
             try:
@@ -973,26 +1489,59 @@ class RaceDataProcessor:
             if len(segment) == 0:
                 continue
 
-            segment['sector'] = (segment['Laptrigger_lapdist_dls'] // sector_size).astype(int)
-            sector_means = segment.groupby('sector')['Speed'].mean()
-
-            for sector, speed in sector_means.items():
-                sector_speeds.setdefault(int(sector), []).append(float(speed))
+            lap_sectors.append((segment['Laptrigger_lapdist_dls'].to_numpy() // sector_size).astype(np.int64))
+            lap_speeds.append(segment['Speed'].to_numpy(dtype=np.float64))
 
-        if not sector_speeds:
+        if not lap_sectors:
             return None
 
-        sector_stats = []
-        for sector, speeds in sector_speeds.items():
-            speeds_arr = np.array(speeds)
-            variance = float(np.var(speeds_arr)) if len(speeds_arr) > 1 else 0.0
-            sector_stats.append({
+        # Matrice (tour x secteur) de sommes/comptes via un seul bincount sur la clé combinée
+        first_sector = min(int(sectors.min()) for sectors in lap_sectors)
+        n_bins = max(int(sectors.max()) for sectors in lap_sectors) - first_sector + 1
+        keys = np.concatenate([
+            row * n_bins + (sectors - first_sector) for row, sectors in enumerate(lap_sectors)
+        ])
+        size = len(lap_sectors) * n_bins
+        sums = np.bincount(keys, weights=np.concatenate(lap_speeds), minlength=size).reshape(-1, n_bins)
+        counts = np.bincount(keys, minlength=size).reshape(-1, n_bins)
+
+        # Dispersion des moyennes par tour de chaque secteur (deux passes)
+        present = counts > 0
+        lap_means = np.divide(sums, counts, out=np.zeros_like(sums), where=present)
+        lap_counts = present.sum(axis=0)
+        used = np.flatnonzero(lap_counts)
+        lap_counts = lap_counts[used]
+        present = present[:, used]
+        lap_means = lap_means[:, used]
+        means = lap_means.sum(axis=0) / lap_counts
+        deviations = np.where(present, lap_means - means, 0.0)
+        variances = np.where(lap_counts > 1, (deviations * deviations).sum(axis=0) / lap_counts, 0.0)
+        ratings = np.select(
+            [variances < bound for bound, _ in self.VARIANCE_RATINGS],
+            [rating for _, rating in self.VARIANCE_RATINGS],
+            default='weak'
+        )
+
+        # Secteurs dans leur ordre d'apparition (tour par tour), départage du tri par variance
+        order = np.lexsort((used, present.argmax(axis=0)))
+        sectors = used + first_sector
+
+        sector_stats = [
+            {
                 'sector': sector,
-                'samples': len(speeds),
+                'samples': samples,
                 'variance': variance,
-                'avg_speed': float(np.mean(speeds_arr)),
-                'rating': self._classify_variance(variance)
-            })
+                'avg_speed': avg_speed,
+                'rating': rating
+            }
+            for sector, samples, variance, avg_speed, rating in zip(
+                sectors[order].tolist(),
+                lap_counts[order].tolist(),
+                variances[order].tolist(),
+                means[order].tolist(),
+                ratings[order].tolist()
+            )
+        ]
 
         sector_stats.sort(key=lambda x: x['variance'], reverse=True)
         weak = [s for s in sector_stats if s['rating'] == 'weak'][:3]
@@ -1004,19 +1553,11 @@ class RaceDataProcessor:
             'strong': strong
         }
 
-    def _classify_variance(self, variance: float) -> str:
-        if variance < 1.5:
-            return 'excellent'
-        if variance < 3.5:
-            return 'good'
-        if variance < 7.0:
-            return 'ok'
-        return 'weak'
-
     def get_race_results_summary(self, circuit: str, race: str = "R1") -> Optional[Dict]:
         cache_key = f"{circuit}_{race}"
-        if cache_key in self.race_results_cache:
-            return self.race_results_cache[cache_key]
+        cached = self.race_results_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         path = self._find_support_file(circuit, race, ["results by class", "provisional results", "results"])
         if not path:
@@ -1025,9 +1566,9 @@ class RaceDataProcessor:
 
         try:
             if path.suffix.lower() == '.parquet':
-                df = pd.read_parquet(path)
+                df = pd.read_parquet(path, columns=self._support_columns(path, self.RESULTS_COLUMNS))
             else:
-                df = pd.read_csv(path, sep=';', engine='python', encoding_errors='ignore')
+                df = self._read_semicolon_csv(path)
         except Exception as exc:
             print(f"⚠️  Could not parse race results file {path.name}: {exc}")
             self.race_results_cache[cache_key] = None
@@ -1062,7 +1603,7 @@ class RaceDataProcessor:
 
         overall = build_row(df.iloc[0])
         if 'BEST_LAP_TIME' in df.columns:
-            df['best_secs'] = df['BEST_LAP_TIME'].apply(self._parse_time_string)
+            df['best_secs'] = self._parse_time_strings(df['BEST_LAP_TIME'])
             best_lap_row = df.dropna(subset=['best_secs']).sort_values('best_secs').iloc[0] if df['best_secs'].notna().any() else None
         else:
             best_lap_row = None
@@ -1075,11 +1616,13 @@ class RaceDataProcessor:
             }
 
         classes = []
+        top_cols = [col for col in ['POS', 'NUMBER', 'LAPS', 'ELAPSED', 'GAP_FIRST', 'BEST_LAP_TIME', 'BEST_LAP_KPH'] if col in df.columns]
         for class_name, group in df.groupby(class_col):
-            class_rows = group.sort_values('POS').head(3)
+            # Records (plain dicts) straight from the top 3, no Series per row
+            top3 = group.nsmallest(3, 'POS')[top_cols].to_dict('records')
             classes.append({
                 'class': class_name,
-                'top': [build_row(row) for _, row in class_rows.iterrows()]
+                'top': [build_row(record) for record in top3]
             })
 
         summary = {
@@ -1094,8 +1637,9 @@ class RaceDataProcessor:
 
     def get_weather_summary(self, circuit: str, race: str = "R1") -> Optional[Dict]:
         cache_key = f"{circuit}_{race}"
-        if cache_key in self.weather_cache:
-            return self.weather_cache[cache_key]
+        cached = self.weather_cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         path = self._find_support_file(circuit, race, ["weather"])
         if not path:
@@ -1104,30 +1648,19 @@ class RaceDataProcessor:
 
         try:
             if path.suffix.lower() == '.parquet':
-                df = pd.read_parquet(path)
+                df = pd.read_parquet(path, columns=self._support_columns(path, self.WEATHER_COLUMNS))
             else:
-                df = pd.read_csv(path, sep=';', engine='python', encoding_errors='ignore')
+                df = self._read_semicolon_csv(path)
         except Exception as exc:
             print(f"⚠️  Could not parse weather file {path.name}: {exc}")
             self.weather_cache[cache_key] = None
             return None
 
-        # Some weather Parquet files store the entire row as a single semicolon-separated column.
+        # Some weather Parquet files store the entire row as a single semicolon-separated column:
+        # parse it again with the C CSV reader, header included
         if len(df.columns) == 1 and ';' in df.columns[0]:
-            raw_column = df.columns[0]
-            split_names = [part.strip() for part in raw_column.split(';')]
-            expanded = df.iloc[:, 0].astype(str).str.split(';', expand=True)
-            if expanded.shape[1] == len(split_names):
-                expanded.columns = split_names
-                df = expanded
-            else:
-                # Fallback: try using the first row as header
-                first_row = expanded.iloc[0].tolist()
-                if len(first_row) == expanded.shape[1]:
-                    df = expanded
-                    df.columns = [f'col_{idx}' for idx in range(expanded.shape[1])]
-                else:
-                    print(f"⚠️  Weather file {path.name} has unexpected format.")
+            lines = [df.columns[0], *df.iloc[:, 0].dropna().astype(str)]
+            df = self._read_semicolon_csv(io.StringIO('\n'.join(lines)))
 
         df.columns = [col.strip().upper() for col in df.columns]
         
@@ -1164,10 +1697,21 @@ class RaceDataProcessor:
         self.weather_cache[cache_key] = summary
         return summary
 
+    def _read_semicolon_csv(self, source) -> pd.DataFrame:
+        """Timing-system exports (';' separated): C parser, malformed lines skipped"""
+        return pd.read_csv(source, sep=';', engine='c', encoding_errors='ignore', on_bad_lines='skip')
+
+    def _support_columns(self, path: Path, wanted) -> Optional[List[str]]:
+        """Parquet columns of a results/weather file worth reading (None = all of them)"""
+        names = pq.ParquetFile(path).schema_arrow.names
+        # Fichier "une colonne" (ligne entière séparée par ';') : il faut la lire telle quelle
+        if len(names) == 1:
+            return None
+        columns = [name for name in names if name.strip().upper() in wanted]
+        return columns or None
+
     def _find_support_file(self, circuit: str, race: str, keywords: List[str]) -> Optional[Path]:
         directory = self.data_path / circuit
-        if not directory.exists():
-            return None
 
         race_tokens = self._build_race_tokens(race)
         lowered_patterns = [kw.lower() for kw in keywords]
@@ -1176,30 +1720,40 @@ class RaceDataProcessor:
             lname = name.lower()
             return any(pattern in lname for pattern in lowered_patterns) and self._name_matches_race(lname, race_tokens)
 
-        for ext in ("*.parquet", "*.csv", "*.CSV"):
-            candidates = sorted([p for p in directory.glob(ext) if matches(p.name)], key=lambda x: x.name)
+        file_names, _ = self._list_directory(directory)
+        for ext in (".parquet", ".csv", ".CSV"):
+            candidates = [name for name in file_names if name.endswith(ext) and matches(name)]
             if candidates:
-                return candidates[0]
+                return directory / candidates[0]
         return None
 
-    def _parse_time_string(self, value: Optional[str]) -> Optional[float]:
-        if not isinstance(value, str):
-            return None
-        value = value.strip()
-        if not value:
-            return None
-        try:
-            parts = value.replace(',', '.').split(':')
-            parts = [p.strip() for p in parts]
-            if len(parts) == 1:
-                return float(parts[0])
-            total = 0.0
-            for idx, part in enumerate(reversed(parts)):
-                factor = 60 ** idx
-                total += float(part) * factor
-            return total
-        except ValueError:
-            return None
+    def _parse_time_strings(self, values: pd.Series) -> pd.Series:
+        """'[[H:]M:]S.sss' strings (',' accepted as decimal mark) -> seconds, NaN when unparseable"""
+        result = pd.Series(np.nan, index=values.index, dtype=float)
+        if not (values.dtype == object or pd.api.types.is_string_dtype(values)):
+            return result
+        # .str renvoie NaN pour les valeurs non str
+        text = values.str.strip()
+        text = text.where(text != '')
+        parts = text.str.replace(',', '.', regex=False).str.split(':', expand=True)
+        if parts.empty:
+            return result
+        numbers = np.column_stack([
+            pd.to_numeric(parts[col].str.strip(), errors='coerce').to_numpy(dtype=float)
+            for col in parts.columns
+        ])
+        part_counts = parts.notna().sum(axis=1).to_numpy()
+
+        # Parties alignées à droite : secondes, puis minutes (x60), heures (x3600)...
+        rows = np.arange(len(parts))
+        total = np.zeros(len(parts))
+        for idx in range(numbers.shape[1]):
+            col = part_counts - 1 - idx
+            present = col >= 0
+            total = total + np.where(present, numbers[rows, np.maximum(col, 0)] * 60 ** idx, 0.0)
+        total[part_counts == 0] = np.nan
+        result[:] = total
+        return result
 
     def get_available_circuits(self) -> List[Dict[str, Any]]:
         """Return a list of circuit directories that have usable Parquet data."""
@@ -1207,9 +1761,11 @@ class RaceDataProcessor:
         if not self.data_path.exists():
             return circuits
 
-        for entry in sorted(self.data_path.iterdir(), key=lambda p: p.name):
-            if not entry.is_dir() or entry.name.startswith('.'):
+        _, dir_names = self._list_directory(self.data_path)
+        for name in dir_names:
+            if name.startswith('.'):
                 continue
+            entry = self.data_path / name
 
             telemetry_exists = self._directory_has_keyword(entry, "telemetry")
             lap_time_exists = self._directory_has_keyword(entry, "lap_time")
@@ -1228,8 +1784,9 @@ class RaceDataProcessor:
     def _discover_races(self, circuit_dir: Path) -> List[str]:
         races = set()
         pattern = re.compile(r'(R\d+)', re.IGNORECASE)
-        for file_path in circuit_dir.glob("*.*"):
-            match = pattern.search(file_path.stem)
+        file_names, _ = self._list_directory(circuit_dir)
+        for name in file_names:
+            match = pattern.search(Path(name).stem)
             if match:
                 races.add(match.group(1).upper())
         return sorted(races)
@@ -1240,9 +1797,10 @@ class RaceDataProcessor:
 
     def _directory_has_keyword(self, directory: Path, keyword: str) -> bool:
         patterns = self._get_patterns(keyword)
-        for ext in ("*.parquet", "*.csv"):
-            for file_path in directory.glob(ext):
-                if self._matches_patterns(file_path.name, patterns):
+        file_names, _ = self._list_directory(directory)
+        for ext in (".parquet", ".csv"):
+            for name in file_names:
+                if name.endswith(ext) and self._matches_patterns(name, patterns):
                     return True
         return False
 
@@ -1264,55 +1822,52 @@ class RaceDataProcessor:
 
     def _find_data_file(self, circuit: str, race: str, keyword: str, prefer_parquet: bool = True) -> Optional[Path]:
         directory = self.data_path / circuit
-        if not directory.exists():
-            return None
 
         race_tokens = self._build_race_tokens(race)
         patterns = self._get_patterns(keyword)
 
-        def match(path: Path) -> bool:
-            name = path.name
+        def match(name: str) -> bool:
             if not self._matches_patterns(name, patterns):
                 return False
             if not self._name_matches_race(name.lower(), race_tokens):
                 return False
             return True
 
+        file_names, _ = self._list_directory(directory)
         if prefer_parquet:
-            candidates = sorted([p for p in directory.glob("*.parquet") if match(p)], key=lambda x: x.name)
+            candidates = [name for name in file_names if name.endswith(".parquet") and match(name)]
             if candidates:
-                return candidates[0]
-
-        candidates = sorted([p for p in directory.glob("*.csv") if match(p)], key=lambda x: x.name)
-        return candidates[0] if candidates else None
-
-    def _to_native(self, value):
-        if isinstance(value, dict):
-            return {k: self._to_native(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [self._to_native(v) for v in value]
-        if isinstance(value, tuple) or isinstance(value, set):
-            return [self._to_native(v) for v in value]
-        if isinstance(value, np.generic):
-            return value.item()
-        if isinstance(value, np.ndarray):
-            return value.tolist()
-        if isinstance(value, pd.Timestamp):
-            return value.isoformat()
-        if isinstance(value, pd.Series):
-            return self._to_native(value.to_dict())
-        if isinstance(value, float):
-            if not math.isfinite(value):
-                return None
-        return value
-    
+                return directory / candidates[0]
+
+        candidates = [name for name in file_names if name.endswith(".csv") and match(name)]
+        return directory / candidates[0] if candidates else None
+
+    def _list_directory(self, directory: Path) -> Tuple[List[str], List[str]]:
+        """Sorted (file names, subdirectory names) of a directory, re-listed only when its mtime changes"""
+        key = str(directory)
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return [], []
+        cached = self._dir_index.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        file_names, dir_names = [], []
+        with os.scandir(directory) as it:
+            for entry in it:
+                (dir_names if entry.is_dir() else file_names).append(entry.name)
+        file_names.sort()
+        dir_names.sort()
+        self._dir_index[key] = (mtime_ns, file_names, dir_names)
+        return file_names, dir_names
+
     def clear_cache(self):
         """Clear all caches"""
-        self.telemetry_cache = {}
-        self.lap_times_cache = {}
-        self.lap_events_cache = {}
-        self.vehicles_cache = {}
-        self.golden_laps = {}
+        for cache in (self.telemetry_cache, self.lap_times_cache, self.lap_events_cache,
+                      self.vehicles_cache, self.golden_laps, self.lap_keys_cache):
+            cache.clear()
+        self.cache_version += 1
         print("🗑️  Cache cleared")
 
 # Global instance
@@ -0,0 +1,27 @@
+"""orjson settings shared by the processor, the routers and the AI coach.
+
+Kept apart from data_processor so that importing it does not build the global
+processor (and run the CSV -> Parquet bootstrap).
+"""
+import numpy as np
+import orjson
+import pandas as pd
+
+# Options/fallback for serializing processor results: orjson handles NumPy arrays and scalars
+# itself and writes NaN/inf as null, so payloads need no conversion pass beforehand
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def json_default(value):
+    """orjson `default` hook for the few types it does not serialize natively"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, pd.Series):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
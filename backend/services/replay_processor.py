@@ -1,7 +1,8 @@
+import random
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any
-from services.data_processor import RaceDataProcessor
+from services.data_processor import RaceDataProcessor, widen_float32
 
 class ReplayProcessor:
     def __init__(self, data_processor: RaceDataProcessor):
@@ -20,12 +21,17 @@ class ReplayProcessor:
 
         if telemetry_df.empty:
             return None
+        telemetry_df = widen_float32(telemetry_df)
 
         # Ensure required columns
         required_cols = ['Laptrigger_lapdist_dls', 'Speed', 'VBOX_Long_Minutes', 'VBOX_Lat_Min', 'aps', 'pbrake_f']
+        has_nan = telemetry_df.reindex(columns=required_cols).isna().any()
         for col in required_cols:
             if col not in telemetry_df.columns:
-                telemetry_df[col] = np.nan
+                telemetry_df[col] = 0.0  # Fallback to 0 when the channel is missing entirely
+                continue
+            if not has_nan[col]:
+                continue
             
             # Interpolate missing values, then forward/backward fill edges
             telemetry_df[col] = telemetry_df[col].interpolate(method='linear', limit_direction='both')
@@ -45,80 +51,65 @@ class ReplayProcessor:
 
         max_distance = float(telemetry_df['Laptrigger_lapdist_dls'].max())
 
-        timeline = []
-        cumulative_time = 0
-        
-        # Initial point
-        timeline.append({
-            'time': 0.0,
-            'position': {
-                'x': self._clean_number(telemetry_df.iloc[0]['VBOX_Long_Minutes']),
-                'y': 0,
-                'z': self._clean_number(telemetry_df.iloc[0]['VBOX_Lat_Min'])
-            },
-            'speed': self._clean_number(telemetry_df.iloc[0]['Speed']),
-            'throttle': self._clean_number(telemetry_df.iloc[0]['aps']),
-            'brake': self._clean_number(telemetry_df.iloc[0]['pbrake_f']),
-            'distance': self._clean_number(telemetry_df.iloc[0]['Laptrigger_lapdist_dls'])
-        })
-
-        for i in range(len(telemetry_df) - 1):
-            current = telemetry_df.iloc[i]
-            next_point = telemetry_df.iloc[i + 1]
-            
-            # Calculate time to next point
-            distance = next_point['Laptrigger_lapdist_dls'] - current['Laptrigger_lapdist_dls']
-            
-            # Skip if distance is negative (data artifact) or zero
-            if distance <= 0:
-                continue
+        # Pas entre échantillons consécutifs, sur des tableaux NumPy plutôt que iloc ligne à ligne
+        lapdist = telemetry_df['Laptrigger_lapdist_dls'].to_numpy(dtype=float)
+        speed = telemetry_df['Speed'].to_numpy(dtype=float)
+        longitude = telemetry_df['VBOX_Long_Minutes'].to_numpy(dtype=float)
+        latitude = telemetry_df['VBOX_Lat_Min'].to_numpy(dtype=float)
+        throttle = telemetry_df['aps'].to_numpy(dtype=float)
+        brake = telemetry_df['pbrake_f'].to_numpy(dtype=float)
+
+        # Calculate time to next point
+        distance = np.diff(lapdist)
+
+        # --- Spatial Glitch Filter ---
+        # Euclidean distance in "minutes" (approx 1852m per minute)
+        eucl_dist_m = np.sqrt(np.diff(latitude) ** 2 + np.diff(longitude) ** 2) * 1852
+
+        # Skip negative/zero distance (data artifact) and GPS glitches (teleport):
+        # physical jump is huge, but lap distance is reasonable.
+        keep = ~((distance <= 0) | ((eucl_dist_m > 50) & (eucl_dist_m > distance * 5)))
+
+        # Distance glitch (spike in lap dist): physical jump is small, so cap the
+        # distance to eucl_dist_m, otherwise the time step turns into slow motion.
+        distance = np.where((distance > 50) & (distance > eucl_dist_m * 5), eucl_dist_m, distance)
+        # -----------------------------
+
+        avg_speed_ms = (speed[:-1] + speed[1:]) / 2 / 3.6  # km/h → m/s
+        # Fallback 1 m/s for very slow speeds (e.g. pit lane or stop)
+        time_step = distance / np.where(avg_speed_ms > 1, avg_speed_ms, 1.0)
+
+        # Initial point, then the end point of every kept step
+        point_idx = np.concatenate(([0], np.flatnonzero(keep) + 1))
+        times = np.concatenate(([0.0], np.cumsum(time_step[keep])))
+        cumulative_time = times[-1]
+
+        # Downsample the index arrays, so dicts are only built for the points we send
+        sampled = self._downsample_indices(len(point_idx), self.max_points)
+        if sampled is not None:
+            point_idx = point_idx[sampled]
+            times = times[sampled]
+
+        timeline = [
+            {
+                'time': t,
+                'position': {'x': x, 'y': 0, 'z': z},
+                'speed': v,
+                'throttle': a,
+                'brake': b,
+                'distance': d,
+            }
+            for t, x, z, v, a, b, d in zip(
+                self._clean_array(times),
+                self._clean_array(longitude[point_idx]),
+                self._clean_array(latitude[point_idx]),
+                self._clean_array(speed[point_idx]),
+                self._clean_array(throttle[point_idx]),
+                self._clean_array(brake[point_idx]),
+                self._clean_array(lapdist[point_idx]),
+            )
+        ]
 
-            # --- Spatial Glitch Filter ---
-            # Calculate Euclidean distance in "minutes" (approx 1852m per minute)
-            d_lat = next_point['VBOX_Lat_Min'] - current['VBOX_Lat_Min']
-            d_long = next_point['VBOX_Long_Minutes'] - current['VBOX_Long_Minutes']
-            eucl_dist_min = (d_lat**2 + d_long**2)**0.5
-            eucl_dist_m = eucl_dist_min * 1852
-
-            # Case 1: GPS Glitch (Teleport)
-            # Physical jump is huge, but lap distance is reasonable.
-            if eucl_dist_m > 50 and eucl_dist_m > distance * 5:
-                 continue
-            
-            # Case 2: Distance Glitch (Spike in lap dist)
-            # Lap distance jump is huge, but physical jump is small.
-            # We trust the physical position more for the path shape, but we need time step.
-            # If distance is huge, time step will be huge -> slow motion.
-            # We can cap the distance to eucl_dist_m if it's way off.
-            if distance > 50 and distance > eucl_dist_m * 5:
-                distance = eucl_dist_m
-            # -----------------------------
-
-            avg_speed_ms = (current['Speed'] + next_point['Speed']) / 2 / 3.6  # km/h → m/s
-            
-            if avg_speed_ms > 1: # Avoid division by zero or very low speeds
-                time_step = distance / avg_speed_ms
-            else:
-                # Fallback for very slow speeds (e.g. pit lane or stop)
-                # Assume a slow constant speed or cap time_step
-                time_step = distance / 1.0 # 1 m/s fallback
-            
-            cumulative_time += time_step
-            
-            timeline.append({
-                'time': self._clean_number(cumulative_time),
-                'position': {
-                    'x': self._clean_number(next_point['VBOX_Long_Minutes']),
-                    'y': 0,
-                    'z': self._clean_number(next_point['VBOX_Lat_Min'])
-                },
-                'speed': self._clean_number(next_point['Speed']),
-                'throttle': self._clean_number(next_point['aps']),
-                'brake': self._clean_number(next_point['pbrake_f']),
-                'distance': self._clean_number(next_point['Laptrigger_lapdist_dls'])
-            })
-
-        timeline = self._downsample_timeline(timeline, self.max_points)
         duration = float(cumulative_time) if cumulative_time else float(timeline[-1]['time'])
 
         return {
@@ -143,23 +134,18 @@ class ReplayProcessor:
             return 0.0
         return number
 
-    def _downsample_timeline(self, timeline: List[Dict[str, Any]], max_points: int) -> List[Dict[str, Any]]:
+    def _clean_array(self, values: np.ndarray) -> List[float]:
+        """Vectorized _clean_number: non-finite values become 0."""
+        return np.where(np.isfinite(values), values, 0.0).tolist()
+
+    def _downsample_indices(self, count: int, max_points: int) -> Optional[np.ndarray]:
         """
-        Reduce timeline density to keep payloads light for the frontend renderer.
-        Preserves start/end and samples uniformly across the lap.
+        Positions to keep so the timeline stays light for the frontend renderer
+        (None when no reduction is needed). Preserves start/end and samples uniformly across the lap.
         """
-        if len(timeline) <= max_points:
-            return timeline
-
-        indices = np.linspace(0, len(timeline) - 1, max_points, dtype=int)
-        selected = []
-        seen = set()
-        for idx in indices:
-            if idx in seen:
-                continue
-            selected.append(timeline[idx])
-            seen.add(idx)
-        return selected
+        if count <= max_points:
+            return None
+        return np.unique(np.linspace(0, count - 1, max_points, dtype=int))
 
     def generate_commentary(self, race_state: Dict[str, Any]) -> Optional[str]:
         """
@@ -169,22 +155,20 @@ class ReplayProcessor:
             'current_time': 45.0
         }
         """
-        import random
-        
+        # Random chance to comment to avoid spam (checked first, before any sorting)
+        if random.random() > 0.3:
+            return None
+
         cars = race_state.get('cars', [])
         if len(cars) < 2:
             return None
 
-        # Sort by position (distance)
-        cars.sort(key=lambda x: x.get('distance', 0), reverse=True)
+        # Sort by position (distance), on a copy so the caller's list is left untouched
+        cars = sorted(cars, key=lambda x: x.get('distance', 0), reverse=True)
         
         leader = cars[0]
         second = cars[1]
         gap = leader.get('distance', 0) - second.get('distance', 0)
-        
-        # Random chance to comment to avoid spam
-        if random.random() > 0.3:
-            return None
 
         templates = []
         
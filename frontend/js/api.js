@@ -16,6 +16,63 @@ async function httpPost(url, payload) {
     return res.json();
 }
 
+// Reads a text/event-stream response and dispatches each JSON event to handlers[event]
+async function httpPostEvents(url, payload, handlers, signal) {
+    const res = await fetch(url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload),
+        signal
+    });
+    if (!res.ok) throw new Error(await res.text());
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            }
+            if (data && handlers[event]) handlers[event](JSON.parse(data));
+        }
+    }
+}
+
+// /analysis/compare ships telemetry samples column-oriented ({ column: [values] });
+// rebuild the per-point rows the charts and track views work with
+function telemetryRows(columns) {
+    if (!columns || Array.isArray(columns)) return columns || [];
+    const keys = Object.keys(columns);
+    const length = keys.length ? columns[keys[0]].length : 0;
+    const rows = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const row = {};
+        for (const key of keys) row[key] = columns[key][i];
+        rows[i] = row;
+    }
+    return rows;
+}
+
+function withTelemetryRows(result) {
+    if (result?.telemetry) {
+        result.telemetry = {
+            user: telemetryRows(result.telemetry.user),
+            golden: telemetryRows(result.telemetry.golden)
+        };
+    }
+    return result;
+}
+
 export const api = {
     async getCircuits() {
         const circuits = await httpGet(`${API_BASE}/circuits`);
@@ -35,12 +92,24 @@ export const api = {
         return httpPost(`${API_BASE}/replay/commentary`, { cars, current_time: currentTime });
     },
     async compareLap(circuit, chassis, car, lap, race = 'R1') {
-        return httpPost(`${API_BASE}/analysis/compare`, {
+        const result = await httpPost(`${API_BASE}/analysis/compare`, {
             circuit,
             chassis,
             car_number: car,
             lap,
             race
         });
+        return withTelemetryRows(result);
+    },
+    // Comparison arrives first; AI coach insights follow once Gemini answers.
+    // Pass an AbortSignal to drop the stream when a newer analysis starts.
+    async compareLapStream(circuit, chassis, car, lap, race = 'R1', { onCompare, onAiCoach, signal } = {}) {
+        return httpPostEvents(`${API_BASE}/analysis/compare/stream`, {
+            circuit,
+            chassis,
+            car_number: car,
+            lap,
+            race
+        }, { compare: (result) => onCompare?.(withTelemetryRows(result)), ai_coach: onAiCoach }, signal);
     }
 };
\ No newline at end of file
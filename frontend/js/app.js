@@ -19,6 +19,8 @@ let currentCoachTab = 'classic';
 
 let currentTrackTab = 'comparison';
 let currentChartTab = 'speed';
+// Stream of the analysis in flight, aborted when a new one starts
+let analysisController = null;
 
 // Initialize App
 async function init() {
@@ -368,24 +370,46 @@ async function analyzeLap() {
     `;
     resultsPanel.classList.remove('hidden');
 
+    analysisController?.abort();
+    const controller = new AbortController();
+    analysisController = controller;
+    // Result of *this* analysis: its AI event must not land on a newer one
+    let analysisResult = null;
+
     try {
         console.log('🔍 Starting analysis...');
 
-        const result = await api.compareLap(
+        await api.compareLapStream(
             state.selectedCircuit,
             state.selectedVehicle.chassis,
             state.selectedVehicle.car_number,
             state.selectedLap.lap_number,
-            state.selectedRace
+            state.selectedRace,
+            {
+                signal: controller.signal,
+                onCompare: (result) => {
+                    if (controller.signal.aborted) return;
+                    analysisResult = result;
+                    state.analysisResult = result;
+                    console.log('✅ Analysis complete:', result);
+
+                    // Display results
+                    displayResults(result);
+                },
+                onAiCoach: (aiData) => {
+                    const result = analysisResult;
+                    if (!result || state.analysisResult !== result) return;
+                    Object.assign(result, aiData);
+                    result.ai_coach = aiData;
+                    console.log('🤖 AI Coach ready:', aiData);
+                    renderAIContainer(aiData);
+                }
+            }
         );
 
-        state.analysisResult = result;
-        console.log('✅ Analysis complete:', result);
-
-        // Display results
-        displayResults(result);
-
     } catch (error) {
+        // Superseded by a newer analysis: that one owns the panels now
+        if (controller.signal.aborted) return;
         console.error('❌ Analysis failed:', error);
         resultsPanel.innerHTML = `
             <div class="bg-red-900 rounded-lg p-12 text-center">
@@ -1068,7 +1092,22 @@ function renderHotZonesPanel(hotZones) {
     `;
 }
 
+function renderAIContainer(aiData) {
+    const aiContainer = document.querySelector('#coach-panel [data-coach-content="ai"]');
+    if (!aiContainer) return;
+    aiContainer.innerHTML = `
+        <h3 class="text-xl font-semibold mb-4 flex items-center gap-2">
+            <span>🤖</span>
+            <span>AI Coach Insights</span>
+        </h3>
+        ${buildAIContent(aiData)}
+    `;
+}
+
 function buildAIContent(aiData) {
+    if (aiData === undefined) {
+        return '<p class="text-sm text-gray-400">Generating AI Coach insights...</p>';
+    }
     if (!aiData) {
         return '<p class="text-sm text-gray-400">AI Coach insights are not available.</p>';
     }
@@ -1149,7 +1188,6 @@ function renderCoachPanel(recommendationsHtml, aiData, sessionContext) {
     sessionContext = sessionContext || {};
 
     const classicContainer = panel.querySelector('[data-coach-content="classic"]');
-    const aiContainer = panel.querySelector('[data-coach-content="ai"]');
     const weatherContainer = panel.querySelector('[data-coach-content="weather"]');
 
     if (classicContainer) {
@@ -1161,15 +1199,7 @@ function renderCoachPanel(recommendationsHtml, aiData, sessionContext) {
             ${recommendationsHtml}
         `;
     }
-    if (aiContainer) {
-        aiContainer.innerHTML = `
-            <h3 class="text-xl font-semibold mb-4 flex items-center gap-2">
-                <span>🤖</span>
-                <span>AI Coach Insights</span>
-            </h3>
-            ${buildAIContent(aiData)}
-        `;
-    }
+    renderAIContainer(aiData);
     if (weatherContainer) {
         weatherContainer.innerHTML = `
             <h3 class="text-xl font-semibold mb-4 flex items-center gap-2">